@@ -0,0 +1,80 @@
+"""
+Info:
+    Shared command line for the benchmark scripts, every case is timed with depression.benchmark.
+
+Usage:
+    python benchmarks/bench_is_prime.py [--output results.json] [--baseline results.json] [--samples 30]
+"""
+from argparse import ArgumentParser
+from json import load, dump
+from os.path import dirname, abspath
+from typing import Callable, Union
+import sys
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from depression import benchmark
+
+
+def _format(nanoseconds: float) -> str:
+    for unit, size in (('s', 1e9), ('ms', 1e6), ('us', 1e3)):
+        if nanoseconds >= size:
+            return f'{nanoseconds / size:.2f} {unit}'
+    return f'{nanoseconds:.0f} ns'
+
+
+def run(cases: Union[dict, Callable], description: str = None, add_arguments: Callable = None, **options) -> dict:
+    """
+    Info:
+        Times every case, prints a table and writes or compares JSON results when asked to on the command line.
+
+    Paramaters:
+        cases: dict | Callable - Case name to (function, args) or (function, args, options) tuples, or a function building them from the parsed arguments.
+        [Optional]description: str -> None - Shown by --help.
+        [Optional]add_arguments: Callable -> None - Adds script specific arguments to the parser.
+        options - Passed to benchmark for every case, like samples or warmup, a case's own options win over them and --samples wins over both.
+
+    Usage:
+        run({'small': (is_prime, (997,))})
+
+    Returns:
+        dict - Case name to report.
+    """
+    parser = ArgumentParser(description=description)
+    parser.add_argument('--output', help='JSON file to write the results to')
+    parser.add_argument('--baseline', help='JSON results of an earlier run to compare against')
+    parser.add_argument('--samples', type=int, help='Amount of timed samples per case')
+    if add_arguments:
+        add_arguments(parser)
+    arguments = parser.parse_args()
+    if callable(cases):
+        cases = cases(arguments)
+
+    chosen = {'samples': arguments.samples} if arguments.samples else {}
+    baseline = {}
+    if arguments.baseline:
+        with open(arguments.baseline, 'r') as baseline_file:
+            baseline = load(baseline_file)
+
+    reports = {}
+    regressions = 0
+    print(f'{"case":<32} {"median":>12} {"p95":>12} {"p99":>12} {"loops":>8}  change')
+    for name, (function, args, *case_options) in cases.items():
+        report = benchmark(function, args=args, baseline=baseline.get(name), **{**options, **(case_options[0] if case_options else {}), **chosen})
+        reports[name] = report
+
+        change = ''
+        comparison = report.get('comparison')
+        if comparison:
+            change = f'{comparison["change"]:+.1%} (p={comparison["p_value"]:.3f})'
+            if comparison['regression']:
+                change += ' REGRESSION'
+                regressions += 1
+        print(f'{name:<32} {_format(report["median_ns"]):>12} {_format(report["p95_ns"]):>12} {_format(report["p99_ns"]):>12} {report["loops"]:>8}  {change}')
+
+    if arguments.output:
+        with open(arguments.output, 'w') as output_file:
+            dump(reports, output_file, indent=4)
+    if regressions:
+        sys.exit(1)
+    return reports
@@ -0,0 +1,48 @@
+"""
+Info:
+    Compares fetching from a local keep-alive http.server with a new connection per request against the pooled HttpClient.
+    Loopback without TLS is the best case for new connections, real hosts gain more from pooling.
+
+Usage:
+    python benchmarks/bench_http_pool.py
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+from _runner import run
+
+from depression import HttpClient, scrape_website
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    wbufsize = 1 << 16
+    body = b'<html>' + b'x' * 2048 + b'</html>'
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def unpooled(url: str) -> str:
+    from requests import get
+    return get(url, timeout=30).text
+
+
+server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+server.daemon_threads = True
+Thread(target=server.serve_forever, daemon=True).start()
+url = f'http://127.0.0.1:{server.server_address[1]}/'
+
+with HttpClient() as client:
+    run({
+        'requests.get (new connection)': (unpooled, (url,)),
+        'HttpClient.scrape (pooled)': (client.scrape, (url,)),
+        'scrape_website (shared client)': (scrape_website, (url,)),
+    }, description=__doc__)
+server.shutdown()
@@ -0,0 +1,35 @@
+"""
+Info:
+    Times is_prime across input sizes, from sieve lookups up to Miller-Rabin on 64-bit numbers.
+    The trial division is_prime it replaced is timed on the same inputs up to 100000007 so the speedup can be read off the table, that case alone takes several seconds per call.
+
+Usage:
+    python benchmarks/bench_is_prime.py
+"""
+from _runner import run
+
+from depression import is_prime, is_prime_many
+
+
+def trial_division_is_prime(number: int) -> bool:
+    if number <= 0: return False
+
+    for i in range(2, number):
+        if number % i == 0: return False
+
+    return True
+
+
+slow = {'samples': 3, 'warmup': 0, 'loops': 1}
+run({
+    'old is_prime(997)': (trial_division_is_prime, (997,)),
+    'is_prime(997)': (is_prime, (997,)),
+    'old is_prime(999983)': (trial_division_is_prime, (999983,), {'samples': 10, 'warmup': 1}),
+    'is_prime(999983)': (is_prime, (999983,)),
+    'old is_prime(100000007)': (trial_division_is_prime, (100000007,), slow),
+    'is_prime(100000007)': (is_prime, (100000007,)),
+    'is_prime(2**61 - 1)': (is_prime, (2 ** 61 - 1,)),
+    'is_prime(2**64 - 59)': (is_prime, (2 ** 64 - 59,)),
+    'is_prime(2**64 - 60)': (is_prime, (2 ** 64 - 60,)),
+    'is_prime_many(range(10**6))': (is_prime_many, (range(10 ** 6),)),
+}, description=__doc__)
@@ -0,0 +1,67 @@
+"""
+Info:
+    Compares the json and yaml parse paths: load_json against iter_json_array and iter_json_lines, and load_yaml and iter_yaml with libyaml against pure python SafeLoader.
+
+Usage:
+    python benchmarks/bench_parsing.py --records 200000
+"""
+from collections import deque
+from json import dump, dumps
+from tempfile import TemporaryDirectory
+
+from _runner import run
+
+from depression import load_json, iter_json_array, iter_json_lines, load_yaml, iter_yaml
+
+directory = TemporaryDirectory()
+
+
+def consume(iterator) -> None:
+    deque(iterator, maxlen=0)
+
+
+def safe_load(file_name: str):
+    from yaml import load, SafeLoader
+    with open(file_name, 'r') as yaml_file:
+        return load(yaml_file, Loader=SafeLoader)
+
+
+def safe_load_all(file_name: str) -> None:
+    from yaml import load_all, SafeLoader
+    with open(file_name, 'r') as yaml_file:
+        consume(load_all(yaml_file, Loader=SafeLoader))
+
+
+def cases(arguments) -> dict:
+    from yaml import safe_dump, safe_dump_all
+
+    records = [{'id': index, 'name': f'item {index}', 'price': index * 1.25, 'tags': ['a', 'b'], 'active': index % 2 == 0} for index in range(arguments.records)]
+    documents = records[:arguments.records // 20]
+    paths = {name: f'{directory.name}/data.{name}' for name in ('json', 'jsonl', 'yaml', 'multi.yaml')}
+    with open(paths['json'], 'w') as json_file:
+        dump(records, json_file)
+    with open(paths['jsonl'], 'w') as lines_file:
+        lines_file.writelines(f'{dumps(record)}\n' for record in records)
+    with open(paths['yaml'], 'w') as yaml_file:
+        safe_dump(documents, yaml_file)
+    with open(paths['multi.yaml'], 'w') as yaml_file:
+        safe_dump_all(documents, yaml_file)
+
+    options = {'samples': 5, 'warmup': 1, 'loops': 1}
+    return {
+        f'load_json {arguments.records}': (load_json, (paths['json'],), options),
+        f'iter_json_array {arguments.records}': (lambda path: consume(iter_json_array(path)), (paths['json'],), options),
+        f'iter_json_lines {arguments.records}': (lambda path: consume(iter_json_lines(path)), (paths['jsonl'],), options),
+        f'load_yaml {len(documents)}': (load_yaml, (paths['yaml'],), options),
+        f'yaml SafeLoader {len(documents)}': (safe_load, (paths['yaml'],), options),
+        f'iter_yaml {len(documents)} documents': (lambda path: consume(iter_yaml(path)), (paths['multi.yaml'],), options),
+        f'yaml SafeLoader {len(documents)} documents': (safe_load_all, (paths['multi.yaml'],), options),
+    }
+
+
+def add_arguments(parser) -> None:
+    parser.add_argument('--records', type=int, default=200000, help='Amount of json records, the yaml files hold a twentieth of them')
+
+
+with directory:
+    run(cases, description=__doc__, add_arguments=add_arguments)
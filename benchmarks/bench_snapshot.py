@@ -0,0 +1,49 @@
+"""
+Info:
+    Compares loading a Database from its JSON file with loading it from a binary snapshot.
+    Every key holds a small dict, the files are built in a temporary directory first.
+
+Usage:
+    python benchmarks/bench_snapshot.py --sizes 10000 1000000 10000000
+"""
+from json import dump
+from shutil import copyfile
+from tempfile import TemporaryDirectory
+
+from _runner import run
+
+from depression import Database
+
+directory = TemporaryDirectory()
+
+
+def load(path: str) -> None:
+    Database(create_new_database=False, path=path)
+
+
+def build(size: int) -> tuple:
+    json_path = f'{directory.name}/json_{size}.json'
+    snapshot_path = f'{directory.name}/snapshot_{size}.json'
+    with open(json_path, 'w') as json_file:
+        dump({f'key{index}': {'id': index, 'name': f'item {index}', 'tags': ['a', 'b']} for index in range(size)}, json_file)
+    copyfile(json_path, snapshot_path)
+    Database(create_new_database=False, path=snapshot_path).snapshot()
+    return json_path, snapshot_path
+
+
+def cases(arguments) -> dict:
+    built = {}
+    for size in arguments.sizes:
+        json_path, snapshot_path = build(size)
+        options = {'samples': 5, 'warmup': 1, 'loops': 1} if size >= 100000 else {}
+        built[f'json load {size} keys'] = (load, (json_path,), options)
+        built[f'snapshot load {size} keys'] = (load, (snapshot_path,), options)
+    return built
+
+
+def add_arguments(parser) -> None:
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000], help='Amounts of keys to load, 10000000 needs several GB of memory')
+
+
+with directory:
+    run(cases, description=__doc__, add_arguments=add_arguments)
@@ -1,16 +1,32 @@
-from typing import Callable, Union
-from time import time, sleep
+from typing import Callable, Union, TYPE_CHECKING
+from sys import modules, byteorder
+from array import array
+from time import time, sleep, perf_counter_ns
 from datetime import datetime
-from threading import Thread
-from multiprocessing import Process
-from functools import wraps
-from json import load as json_load, dump
-from yaml import safe_load as yaml_load
-from math import sqrt
-from requests import get
-from statistics import mean, median
-from hashlib import sha256
-from js2py import run_file
+from threading import Thread, Timer, RLock
+from contextlib import contextmanager, nullcontext
+from functools import wraps, partial
+from collections import OrderedDict, deque
+from collections.abc import MutableMapping
+from mmap import mmap, ACCESS_READ
+from itertools import islice, takewhile
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from json import load as json_load, dump, dumps, loads
+from os import fsync, replace, fstat, stat, unlink, makedirs, scandir, getpid, readlink
+from struct import Struct
+from zlib import crc32
+from marshal import dumps as marshal_dumps, loads as marshal_loads
+import gc
+if TYPE_CHECKING:
+    import numpy
+try:
+    from fcntl import flock, LOCK_EX, LOCK_UN
+except ImportError:
+    flock = None
+from os.path import getsize
+from math import sqrt, isqrt, gcd, fsum
+from hashlib import sha256, new as new_hash
 
 def get_time() -> dict:
     """
@@ -70,10 +86,147 @@ def is_even(number: int) -> bool:
     """
     return number % 2 == 0
 
+_EVEN_TABLE = bytes(1 - (byte & 1) for byte in range(256))
+
+def is_even_many(numbers: Union[list, array, 'numpy.ndarray']) -> Union[bytearray, 'numpy.ndarray']:
+    """
+    Info:
+        Checks if every number is even in one call, numpy arrays and integer arrays are checked without a python loop.
+
+    Paramaters:
+        numbers: Union[list, array, numpy.ndarray] - The numbers to check if are even.
+
+    Usage:
+        is_even_many(numbers)
+
+    Returns:
+        Union[bytearray, numpy.ndarray] - A numpy bool array for numpy input, otherwise a bytearray of 1 for even and 0 for odd.
+    """
+    numpy = modules.get('numpy')
+    if numpy is not None and isinstance(numbers, numpy.ndarray):
+        return numbers % 2 == 0
+
+    if not isinstance(numbers, array) or numbers.typecode not in 'bBhHiIlLqQ':
+        try:
+            numbers = array('q', numbers)
+        except (TypeError, OverflowError):
+            return bytearray(number % 2 == 0 for number in numbers)
+
+    start = 0 if byteorder == 'little' else numbers.itemsize - 1
+    return bytearray(memoryview(numbers).cast('B')[start::numbers.itemsize]).translate(_EVEN_TABLE)
+
+_SIEVE_LIMIT = 1 << 20
+_SIEVE_BATCH_LIMIT = 1 << 26
+_SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+class _PrimeSieve:
+    """
+    Info:
+        Lazily grown sieve of Eratosthenes over the odd numbers, packed eight numbers per byte.
+
+    Usage:
+        _PrimeSieve().is_prime(number)
+    """
+    def __init__(self) -> None:
+        self.limit = 0
+        self.bits = b''
+
+    def grow(self, number: int) -> None:
+        """
+        Info:
+            Grows the sieve so it covers every number up to the given number, at least doubling its size.
+
+        Paramaters:
+            number: int - The number the sieve has to cover.
+
+        Usage:
+            _PrimeSieve().grow(number)
+
+        Returns:
+            None
+        """
+        if number <= self.limit:
+            return
+
+        limit = max(number, self.limit * 2, 1 << 16)
+        size = (limit >> 1) + 1
+        flags = bytearray(b'\x01') * size
+        flags[0] = 0
+        for index in range(1, (isqrt(limit) >> 1) + 1):
+            if flags[index]:
+                prime = 2 * index + 1
+                start = prime * prime >> 1
+                flags[start::prime] = bytes(len(range(start, size, prime)))
+
+        flags.extend(bytes(-len(flags) % 8))
+        packed = 0
+        for bit in range(8):
+            packed |= int.from_bytes(flags[bit::8], 'little') << bit
+
+        self.bits, self.limit = packed.to_bytes(len(flags) >> 3, 'little'), limit
+
+    def is_prime(self, number: int) -> bool:
+        """
+        Info:
+            Looks the number up in the sieve, growing it first when needed.
+
+        Paramaters:
+            number: int - The number to check if is prime.
+
+        Usage:
+            _PrimeSieve().is_prime(number)
+
+        Returns:
+            bool
+        """
+        if number < 3:
+            return number == 2
+        if not number & 1:
+            return False
+
+        self.grow(number)
+        index = number >> 1
+        return bool(self.bits[index >> 3] >> (index & 7) & 1)
+
+_prime_sieve = _PrimeSieve()
+
+def _miller_rabin(number: int, bases: tuple) -> bool:
+    """
+    Info:
+        Runs the strong probable prime test on an odd number greater than the largest base.
+
+    Paramaters:
+        number: int - The odd number to test.
+        bases: tuple - The witnesses to test against.
+
+    Usage:
+        _miller_rabin(number, bases)
+
+    Returns:
+        bool
+    """
+    exponent = number - 1
+    shifts = (exponent & -exponent).bit_length() - 1
+    exponent >>= shifts
+
+    for base in bases:
+        x = pow(base, exponent, number)
+        if x == 1 or x == number - 1:
+            continue
+        for _ in range(shifts - 1):
+            x = x * x % number
+            if x == number - 1:
+                break
+        else:
+            return False
+
+    return True
+
 def is_prime(number: int) -> bool:
     """
     Info:
-        Check if a number is prime, if so return True if not return False
+        Check if a number is prime, if so return True if not return False.
+        Numbers up to 2^20 are looked up in a cached sieve, larger ones use Miller-Rabin which is deterministic below 3.3 * 10^24.
     
     Paramaters:
         number: int - The number to check if is prime.
@@ -84,61 +237,278 @@ def is_prime(number: int) -> bool:
     Returns:
         bool
     """
-    if number <= 0: return False
-        
-    for i in range(2, number):
-        if number % i == 0: return False
+    if number <= _SIEVE_LIMIT or number <= _prime_sieve.limit:
+        return _prime_sieve.is_prime(number)
 
-    return True
+    for prime in _SMALL_PRIMES:
+        if number % prime == 0:
+            return False
+
+    return _miller_rabin(number, _SMALL_PRIMES)
 
-def prime_factors(number: int) -> list:
+def is_prime_many(numbers: Union[list, array, 'numpy.ndarray']) -> Union[bytearray, 'numpy.ndarray']:
+    """
+    Info:
+        Checks if every number is prime in one call.
+        The shared sieve is grown once to cover the largest number (up to 2^26), anything above that goes through is_prime.
+
+    Paramaters:
+        numbers: Union[list, array, numpy.ndarray] - The numbers to check if are prime.
+
+    Usage:
+        is_prime_many(numbers)
+
+    Returns:
+        Union[bytearray, numpy.ndarray] - A numpy bool array for numpy input, otherwise a bytearray of 1 for prime and 0 for not prime.
+    """
+    numpy = modules.get('numpy')
+    if numpy is not None and isinstance(numbers, numpy.ndarray):
+        result = numpy.zeros(numbers.shape, dtype=bool)
+        if not numbers.size:
+            return result
+
+        _prime_sieve.grow(min(int(numbers.max()), _SIEVE_BATCH_LIMIT))
+        bits = numpy.frombuffer(_prime_sieve.bits, dtype=numpy.uint8)
+        sieved = (numbers > 2) & (numbers <= _prime_sieve.limit) & (numbers % 2 == 1)
+        indexes = numbers[sieved] >> 1
+        result[sieved] = (bits[indexes >> 3] >> (indexes & 7)) & 1
+        result[numbers == 2] = True
+        for position in zip(*numpy.nonzero(numbers > _prime_sieve.limit)):
+            result[position] = is_prime(int(numbers[position]))
+        return result
+
+    if not isinstance(numbers, (list, tuple, array)):
+        numbers = list(numbers)
+    if not numbers:
+        return bytearray()
+
+    _prime_sieve.grow(min(max(numbers), _SIEVE_BATCH_LIMIT))
+    bits, limit = _prime_sieve.bits, _prime_sieve.limit
+    return bytearray(
+        bits[number >> 4] >> (number >> 1 & 7) & 1 if 2 < number <= limit and number & 1
+        else number == 2 or (number > limit and is_prime(number))
+        for number in numbers
+    )
+
+_TRIAL_DIVISION_LIMIT = 1000
+
+def _pollard_brent(number: int) -> int:
+    """
+    Info:
+        Finds a non trivial factor of an odd composite number with Brent's variant of Pollard's rho.
+
+    Paramaters:
+        number: int - The odd composite number to split.
+
+    Usage:
+        _pollard_brent(number)
+
+    Returns:
+        int
+    """
+    constant = 0
+    while True:
+        constant += 1
+        y, power, product, divisor = 2, 1, 1, 1
+
+        while divisor == 1:
+            x = y
+            for _ in range(power):
+                y = (y * y + constant) % number
+
+            steps = 0
+            while steps < power and divisor == 1:
+                saved_y = y
+                for _ in range(min(128, power - steps)):
+                    y = (y * y + constant) % number
+                    product = product * abs(x - y) % number
+                divisor = gcd(product, number)
+                steps += 128
+            power <<= 1
+
+        if divisor == number:
+            divisor = 1
+            while divisor == 1:
+                saved_y = (saved_y * saved_y + constant) % number
+                divisor = gcd(abs(x - saved_y), number)
+
+        if divisor != number:
+            return divisor
+
+def factorize(number: int) -> dict:
+    """
+    Info:
+        Factorizes the number into its prime factors and how many times each one divides it.
+        Small factors are found by trial division and the rest with Pollard-Brent rho.
+
+    Paramaters:
+        number: int - The number to factorize.
+
+    Usage:
+        factorize(100)
+
+    Returns:
+        dict
+    """
+    factors = {}
+    if number < 2:
+        return factors
+
+    divisor = 2
+    while divisor < _TRIAL_DIVISION_LIMIT and divisor * divisor <= number:
+        while number % divisor == 0:
+            factors[divisor] = factors.get(divisor, 0) + 1
+            number //= divisor
+        divisor += 1 if divisor == 2 else 2
+
+    remaining = [number] if number > 1 else []
+    while remaining:
+        number = remaining.pop()
+        if is_prime(number):
+            factors[number] = factors.get(number, 0) + 1
+            continue
+
+        root = isqrt(number)
+        if root * root == number:
+            remaining += [root, root]
+            continue
+
+        divisor = _pollard_brent(number)
+        remaining += [divisor, number // divisor]
+
+    return dict(sorted(factors.items()))
+
+def prime_factors(number: int, multiplicities: bool = False) -> Union[list, dict]:
     """
     Info:
         Generates a list of prime numbers that are factors of the given number.
+        A prime number has no smaller prime factors so it gives an empty list.
 
     Paramaters:
         number: int - The number to get prime factors of.
+        [Optional]multiplicities: bool -> False - If true, returns every prime factor with how many times it divides the number, like factorize.
 
     Usage:
-        prime_facotrs(100)
+        prime_factors(100)
+        prime_factors(100, multiplicities=True)
 
     Returns:
-        list
+        Union[list, dict]
     """
-    factors = []
-    if is_prime(number) or number < 3:
-        return factors
-        
-    for i in range(2, number):
-        if number % i == 0 and is_prime(i):
-            factors.append(i)
-            
-    return factors
+    if multiplicities:
+        return factorize(number)
+
+    if number < 3 or is_prime(number):
+        return []
+
+    return list(factorize(number))
     
-def convert_list_items(old_list: list, convert_type: type):
+class ConversionError(Exception):
+    """
+    Info:
+        Raised by convert_list_items when a chunk of items could not be converted in parallel mode.
+
+    Attributes:
+        start: int - Index of the first item of the failed chunk.
+        end: int - Index after the last item of the failed chunk.
+        error: Exception - The error the converter raised.
+    """
+    def __init__(self, start: int, end: int, error: Exception) -> None:
+        super().__init__(f'Could not convert items {start} to {end - 1}: {error!r}')
+        self.start = start
+        self.end = end
+        self.error = error
+
+def _convert_chunk(convert_type: type, chunk: list) -> list:
+    return [convert_type(item) for item in chunk]
+
+def _convert_parallel(old_list: list, convert_type: type, workers: int, chunk_size: int, processes: bool):
+    """
+    Info:
+        Converts the items in chunks across a thread or process pool and yields them back in order.
+        At most two chunks per worker are in flight so long inputs are not read all at once.
+
+    Paramaters:
+        old_list: list - Items to convert.
+        convert_type: type - The type to convert to.
+        workers: int - Amount of workers in the pool.
+        chunk_size: int - Amount of items sent to a worker at once.
+        processes: bool - If true, uses a process pool instead of a thread pool.
+
+    Usage:
+        _convert_parallel(old_list, convert_type, workers, chunk_size, processes)
+
+    Returns:
+        Generator
+    """
+    if processes:
+        from concurrent.futures import ProcessPoolExecutor as pool_type
+    else:
+        pool_type = ThreadPoolExecutor
+
+    items = iter(old_list)
+    pending = deque()
+    start = 0
+
+    with pool_type(max_workers=workers) as pool:
+        try:
+            while True:
+                while len(pending) < workers * 2:
+                    chunk = [*islice(items, chunk_size)]
+                    if not chunk:
+                        break
+                    pending.append((start, start + len(chunk), pool.submit(_convert_chunk, convert_type, chunk)))
+                    start += len(chunk)
+
+                if not pending:
+                    return
+
+                chunk_start, chunk_end, future = pending.popleft()
+                try:
+                    converted = future.result()
+                except Exception as error:
+                    raise ConversionError(chunk_start, chunk_end, error) from error
+                yield from converted
+        finally:
+            for *_, future in pending:
+                future.cancel()
+
+def convert_list_items(old_list: list, convert_type: type, lazy: bool = False, workers: int = None, chunk_size: int = 1000, processes: bool = False):
     """
     Info:
         Converts each list item to the type specified
+        Giving workers converts chunks of items in a thread pool, or a process pool with processes, keeping their order.
     
     Paramaters:
         old_list: list - List to convert
         convert_type: type - The type to convert to.
+        [Optional]lazy: bool -> False - If true, returns a generator that converts items as they are needed.
+        [Optional]workers: int -> None - Amount of workers to convert with in parallel, None converts in this thread.
+        [Optional]chunk_size: int -> 1000 - Amount of items each worker converts at once.
+        [Optional]processes: bool -> False - If true, uses processes instead of threads, convert_type and the items must be picklable.
 
     Usage:
         convert_list_items(old_list, convert_type)
+        convert_list_items(old_list, convert_type, lazy=True, workers=4)
 
     Returns:
-        list
+        Union[list, Generator]
+
+    Raises:
+        ConversionError - When a chunk fails in parallel mode.
     """
-    new_list = []
-    for item in old_list:
-        new_list.append(convert_type(item))
-    return new_list
+    if workers:
+        converted = _convert_parallel(old_list, convert_type, workers, chunk_size, processes)
+    else:
+        converted = map(convert_type, old_list)
+
+    return converted if lazy else [*converted]
 
 def remove_list_duplicates(list: list, amount: int = 1) -> list:
     """
     Info:
         Removes any duplicates from the list given with the amount, then retursn that list
+        Items are counted in a dict, unhashable items fall back to a slower list of counts.
     
     Paramaters:
         list: list - The list to remove duplicates from.
@@ -150,11 +520,53 @@ def remove_list_duplicates(list: list, amount: int = 1) -> list:
     Returns:
         list
     """
-    clean_list = []
-    for item in list:
-        if clean_list.count(item) < amount:
-            clean_list.append(item)
-    return clean_list
+    return [*iter_unique(list, amount)]
+
+def iter_unique(iterable, amount: int = 1, max_size: int = None):
+    """
+    Info:
+        Lazily yields the items of the iterable, skipping an item once it has been seen amount times.
+        With max_size only that many hashable items are remembered, the least recently seen one is forgotten first so memory stays bounded on endless streams.
+
+    Paramaters:
+        iterable: Iterable - The items to remove duplicates from.
+        [Optional]amount: int -> 1 - Amount of duplicates wanted
+        [Optional]max_size: int -> None - Amount of items to remember, None remembers all of them.
+
+    Usage:
+        for item in iter_unique(iterable):
+
+    Returns:
+        Generator
+    """
+    counts = OrderedDict() if max_size else {}
+    unhashable = []
+
+    for item in iterable:
+        try:
+            count = counts.get(item, 0)
+        except TypeError:
+            for entry in unhashable:
+                if entry[0] == item:
+                    break
+            else:
+                entry = [item, 0]
+                unhashable.append(entry)
+
+            if entry[1] < amount:
+                entry[1] += 1
+                yield item
+            continue
+
+        if max_size:
+            if count:
+                counts.move_to_end(item)
+            elif len(counts) >= max_size:
+                counts.popitem(last=False)
+
+        if count < amount:
+            counts[item] = count + 1
+            yield item
 
 def timer(raw_format: bool = False) -> Callable:
     """
@@ -246,6 +658,7 @@ def multiprocess() -> Callable:
         
         @wraps(function)
         def wrapper_function(*args, **kwargs) -> None:
+            from multiprocessing import Process
             Process(target=function, args=args, kwargs=kwargs).start()
 
         return wrapper_function
@@ -276,13 +689,190 @@ def wait(before_time: int, after_time: int) -> Callable:
         return wrapper_function
     return decorator
 
-def average_time(amount: int) -> Callable:
+def _mann_whitney(first: list, second: list) -> float:
+    """
+    Info:
+        Returns the two sided p-value of a Mann-Whitney U test, the chance of two samples this different coming from the same distribution.
+        Uses the normal approximation with a tie correction, which holds from about ten values per sample.
+
+    Paramaters:
+        first: list - The first sample.
+        second: list - The second sample.
+
+    Usage:
+        _mann_whitney(times, baseline_times)
+
+    Returns:
+        float
+    """
+    from statistics import NormalDist
+
+    ranked = sorted([(value, True) for value in first] + [(value, False) for value in second])
+    total = len(ranked)
+    rank_sum = ties = 0
+    start = 0
+    while start < total:
+        end = start
+        while end < total and ranked[end][0] == ranked[start][0]:
+            end += 1
+        rank_sum += (start + end + 1) / 2 * sum(ranked[index][1] for index in range(start, end))
+        ties += (end - start) ** 3 - (end - start)
+        start = end
+
+    size, other_size = len(first), len(second)
+    variance = size * other_size / 12 * (total + 1 - ties / (total * (total - 1))) if total > 1 else 0
+    if variance <= 0:
+        return 1.0
+    z = (rank_sum - size * (size + 1) / 2 - size * other_size / 2) / sqrt(variance)
+    return 2 * (1 - NormalDist().cdf(abs(z)))
+
+def _benchmark(function: Callable, args: tuple, kwargs: dict, samples: int, warmup: int, sample_time: float, loops: int, collect: bool) -> tuple:
+    """
+    Info:
+        Runs the warmup, calibration and timed samples of benchmark and returns the report with the function's last return value.
+
+    Paramaters:
+        function: Callable - The function to time.
+        args: tuple - Positional arguments to call it with.
+        kwargs: dict - Keyword arguments to call it with.
+        samples: int - Amount of timed samples.
+        warmup: int - Amount of untimed calls first.
+        sample_time: float - Seconds one sample should take at least when calibrating.
+        loops: int - Calls per sample, None calibrates it.
+        collect: bool - Leaves the garbage collector on while timing.
+
+    Usage:
+        _benchmark(function, args, kwargs, samples, warmup, sample_time, loops, collect)
+
+    Returns:
+        tuple - (report, result)
+    """
+    from statistics import median, stdev, quantiles
+
+    result = None
+    start = perf_counter_ns()
+    for _ in range(warmup):
+        result = function(*args, **kwargs)
+    warmup_ns = perf_counter_ns() - start
+
+    def sample(loops: int) -> int:
+        nonlocal result
+        start = perf_counter_ns()
+        for _ in range(loops):
+            result = function(*args, **kwargs)
+        return perf_counter_ns() - start
+
+    if loops is None:
+        loops = 1
+        while True:
+            for step in (1, 2, 5):
+                if sample(loops * step) >= sample_time * 1e9:
+                    loops *= step
+                    break
+            else:
+                loops *= 10
+                continue
+            break
+
+    times = []
+    gc.collect()
+    with (nullcontext() if collect else _gc_paused()):
+        for _ in range(samples):
+            times.append(sample(loops) / loops)
+
+    percentiles = quantiles(times, n=100, method='inclusive') if len(times) > 1 else times * 99
+    report = {
+        'name': getattr(function, '__qualname__', repr(function)),
+        'samples': samples,
+        'loops': loops,
+        'warmup': warmup,
+        'warmup_ns': warmup_ns,
+        'min_ns': min(times),
+        'max_ns': max(times),
+        'mean_ns': fsum(times) / len(times),
+        'median_ns': median(times),
+        'p95_ns': percentiles[94],
+        'p99_ns': percentiles[98],
+        'stdev_ns': stdev(times) if len(times) > 1 else 0.0,
+        'times_ns': times
+    }
+    return report, result
+
+def benchmark(function: Callable, args: tuple = (), kwargs: dict = None, samples: int = 30, warmup: int = 3, sample_time: float = 0.01, loops: int = None, collect: bool = False, output: str = None, baseline: Union[str, dict] = None, alpha: float = 0.01, threshold: float = 0.05) -> dict:
+    """
+    Info:
+        Times a function and returns its statistics in nanoseconds per call, measured with perf_counter_ns.
+        The function is warmed up, then the amount of loops per sample is raised until one sample takes at least sample_time, and the samples are taken with the garbage collector off.
+        Given a baseline report the samples are compared with a Mann-Whitney U test, a regression is flagged when the difference is significant and the median got slower by more than threshold.
+
+    Paramaters:
+        function: Callable - The function to time.
+        [Optional]args: tuple -> () - Positional arguments to call it with.
+        [Optional]kwargs: dict -> None - Keyword arguments to call it with.
+        [Optional]samples: int -> 30 - Amount of timed samples.
+        [Optional]warmup: int -> 3 - Amount of untimed calls before calibrating.
+        [Optional]sample_time: float -> 0.01 - Seconds one sample should take at least when calibrating.
+        [Optional]loops: int -> None - Calls per sample, None calibrates it.
+        [Optional]collect: bool -> False - Leaves the garbage collector on while timing.
+        [Optional]output: str -> None - JSON file to write the report to.
+        [Optional]baseline: str | dict -> None - A report or the JSON file of one to compare against.
+        [Optional]alpha: float -> 0.01 - Highest p-value counted as significant.
+        [Optional]threshold: float -> 0.05 - Smallest relative slowdown of the median counted as a regression.
+
+    Usage:
+        report = benchmark(my_function, args=(1, 2), output='bench.json')
+        benchmark(my_function, args=(1, 2), baseline='bench.json')['comparison']['regression']
+
+    Returns:
+        dict
+    """
+    report, _ = _benchmark(function, args, kwargs or {}, samples, warmup, sample_time, loops, collect)
+    return _finish_benchmark(report, output, baseline, alpha, threshold)
+
+def _finish_benchmark(report: dict, output: str, baseline: Union[str, dict], alpha: float, threshold: float) -> dict:
+    """
+    Info:
+        Adds the baseline comparison to a report and writes it to output, see benchmark for the paramaters.
+
+    Usage:
+        _finish_benchmark(report, output, baseline, alpha, threshold)
+
+    Returns:
+        dict
+    """
+    if baseline is not None:
+        if isinstance(baseline, str):
+            with open(baseline, 'r') as baseline_file:
+                baseline = json_load(baseline_file)
+
+        change = report['median_ns'] / baseline['median_ns'] - 1
+        p_value = _mann_whitney(report['times_ns'], baseline['times_ns'])
+        report['comparison'] = {
+            'baseline_median_ns': baseline['median_ns'],
+            'change': change,
+            'p_value': p_value,
+            'significant': p_value < alpha,
+            'regression': p_value < alpha and change > threshold
+        }
+
+    if output is not None:
+        with open(output, 'w') as output_file:
+            dump(report, output_file, indent=4)
+    return report
+
+def average_time(amount: int, warmup: int = 0, loops: int = 1, output: str = None, baseline: Union[str, dict] = None) -> Callable:
     """
     Info:
         Runs the function x amount of times and then collects how long it took to run, after that gets the mean of the list of times to run.
+        Timing is done by benchmark, the report is printed and the function's last return value is returned.
+        With the defaults the function runs exactly amount times, warmup and calibrating with loops=None add untimed calls.
 
     Paramaters:
         amount: int - The amount of times you want calculated.
+        [Optional]warmup: int -> 0 - Amount of untimed calls first.
+        [Optional]loops: int -> 1 - Calls per timed sample, None calibrates it.
+        [Optional]output: str -> None - JSON file to write the report to.
+        [Optional]baseline: str | dict -> None - A report or the JSON file of one to compare against, regressions are alerted.
 
     Usage:
         @average_time(amount=1)
@@ -291,14 +881,16 @@ def average_time(amount: int) -> Callable:
     def decorator(function: Callable, *args, **kwargs) -> Callable:
 
         @wraps(function)
-        def wrapper_function(*args, **kwargs) -> None:
-            times = []
-            for i in range(amount):
-                start_time = time()
-                function(*args, **kwargs)
-                end_time = time()
-                times.append(end_time - start_time)
-            print(f"{function.__name__}: {amount} loops\nTotal time: {sum(times)}\nAverage time: {get_mean(times)}\nLowest Time: {min(times)}\nHighest Time: {max(times)}\nAll times: {', '.join(convert_list_items(times, str))}\n")
+        def wrapper_function(*args, **kwargs):
+            report, result = _benchmark(function, args, kwargs, amount, warmup, 0.01, loops, False)
+            report = _finish_benchmark(report, output, baseline, 0.01, 0.05)
+            seconds = {key: value / 1e9 for key, value in report.items() if key.endswith('_ns') and not isinstance(value, list)}
+            print(f"{function.__name__}: {amount} samples of {report['loops']} loops\nTotal time: {seconds['mean_ns'] * amount * report['loops']}\nAverage time: {seconds['mean_ns']}\nMedian time: {seconds['median_ns']}\nLowest Time: {seconds['min_ns']}\nHighest Time: {seconds['max_ns']}\n95th percentile: {seconds['p95_ns']}\n99th percentile: {seconds['p99_ns']}\nStandard deviation: {seconds['stdev_ns']}\n")
+
+            comparison = report.get('comparison')
+            if comparison and comparison['regression']:
+                Log().alert(f"{function.__name__} is {comparison['change']:.1%} slower than its baseline (p={comparison['p_value']:.4f})")
+            return result
 
         return wrapper_function
     return decorator
@@ -601,71 +1193,331 @@ class Log:
         print(f'{color(text="ALERT:", foreground="yellow", styles=["underline"])}\n    {color(text=text, foreground="yellow", styles=["bold"])}')
 
 
-def load_json(file_name: str):
+_file_cache = {}
+_file_cache_lock = RLock()
+
+def _copy_value(value):
+    """
+    Info:
+        Returns a deep copy of a parsed json or yaml value.
+        Plain json values are copied with marshal which is many times faster than deepcopy, anything marshal can not hold falls back to deepcopy.
+
+    Paramaters:
+        value - The value to copy.
+
+    Usage:
+        _copy_value(value)
+
+    Returns:
+        A copy of value
+    """
+    try:
+        return marshal_loads(marshal_dumps(value))
+    except ValueError:
+        from copy import deepcopy
+        return deepcopy(value)
+
+def _freeze_value(value):
+    """
+    Info:
+        Returns a read only version of a parsed value, dicts become mapping proxies, lists become tuples and sets become frozensets.
+
+    Paramaters:
+        value - The value to freeze.
+
+    Usage:
+        _freeze_value(value)
+
+    Returns:
+        A read only copy of value
+    """
+    from types import MappingProxyType
+
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze_value(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze_value(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+def _load_cached(file_name: str, parse: Callable, mode: str):
+    """
+    Info:
+        Returns the parsed value of a file, parsing it again only when its mtime, ctime, size or inode changed since it was cached.
+
+    Paramaters:
+        file_name: str - The file to load.
+        parse: Callable - Turns the opened file into its value.
+        mode: str - copy returns a private copy, frozen returns a shared read only value and shared returns the cached value itself.
+
+    Usage:
+        _load_cached(file_name, json_load, 'copy')
+
+    Returns:
+        The parsed value
+    """
+    if mode not in ('copy', 'frozen', 'shared'):
+        raise ValueError(f'mode must be copy, frozen or shared, not {mode!r}')
+
+    from os.path import abspath
+
+    key = (abspath(file_name), parse)
+    info = stat(file_name)
+    version = (info.st_mtime_ns, info.st_ctime_ns, info.st_size, info.st_ino)
+    cached = _file_cache.get(key)
+    if cached is None or cached[0] != version:
+        with open(file_name, 'r') as my_file_raw:
+            info = fstat(my_file_raw.fileno())
+            version = (info.st_mtime_ns, info.st_ctime_ns, info.st_size, info.st_ino)
+            value = parse(my_file_raw)
+        cached = [version, value, None]
+        with _file_cache_lock:
+            _file_cache[key] = cached
+
+    if mode == 'shared':
+        return cached[1]
+    if mode == 'copy':
+        return _copy_value(cached[1])
+    if cached[2] is None:
+        cached[2] = _freeze_value(cached[1])
+    return cached[2]
+
+def invalidate_file_cache(file_name: str = None) -> None:
+    """
+    Info:
+        Drops a file from the load_json and load_yaml cache so the next call parses it again.
+
+    Paramaters:
+        [Optional]file_name: str -> None - The file to drop, None drops every cached file.
+
+    Usage:
+        invalidate_file_cache(file)
+
+    Returns:
+        None
+    """
+    from os.path import abspath
+
+    with _file_cache_lock:
+        if file_name is None:
+            _file_cache.clear()
+            return
+        path = abspath(file_name)
+        for key in [key for key in _file_cache if key[0] == path]:
+            del _file_cache[key]
+
+def load_json(file_name: str, cache: bool = False, mode: str = 'copy'):
     """
     Info:
         Loads the given json file and returns its value.
+        With cache the parsed value is kept and the file is only parsed again once it changes on disk.
 
     Paramaters:
         file_name: str - File name, ending with .json.
+        [Optional]cache: bool -> False - Reuses the parsed value while the file's mtime and size stay the same.
+        [Optional]mode: str -> copy - With cache, copy returns a private copy, frozen a shared read only value and shared the cached value itself.
 
     Usgae:
         load_json(file)
+        load_json(file, cache=True, mode='frozen')
 
     Returns:
         dict
     """
+    if cache:
+        return _load_cached(file_name, json_load, mode)
     
     with open(file_name, 'r') as my_file_raw:
         my_file = json_load(my_file_raw)
         return my_file
 
-def load_yaml(file_name: str):
+def _yaml_loader():
+    """
+    Info:
+        Returns libyaml's CSafeLoader when pyyaml was built with it and the pure python SafeLoader otherwise.
+        Both accept the same documents, the C one parses them about ten times faster.
+
+    Usage:
+        _yaml_loader()
+
+    Returns:
+        yaml.SafeLoader or yaml.CSafeLoader
+    """
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    return loader
+
+def _yaml_load(stream):
+    from yaml import load as yaml_load
+    return yaml_load(stream, Loader=_yaml_loader())
+
+def load_yaml(file_name: str, cache: bool = False, mode: str = 'copy'):
     """
     Info:
         Loads the given yaml file and returns its value.
+        With cache the parsed value is kept and the file is only parsed again once it changes on disk.
 
     Paramaters:
         file_name: str - File name, ending with .yaml or .yml.
+        [Optional]cache: bool -> False - Reuses the parsed value while the file's mtime and size stay the same.
+        [Optional]mode: str -> copy - With cache, copy returns a private copy, frozen a shared read only value and shared the cached value itself.
 
     Usgae:
         load_yaml(file)
+        load_yaml(file, cache=True, mode='frozen')
 
     Returns:
         dict
     """
-    
+    if cache:
+        return _load_cached(file_name, _yaml_load, mode)
+
     with open(file_name, 'r') as my_file_raw:
-        my_file = yaml_load(my_file_raw)
+        my_file = _yaml_load(my_file_raw)
         return my_file
 
-def square_root(number: int) -> int:
+def iter_json_lines(file_name: str):
     """
     Info:
-        Returns the square root of a number.
+        Yields the value of every line of a json lines file one at a time, blank lines are skipped.
+        Only one line is held in memory so files bigger than memory can be read.
 
     Paramaters:
-        number: int - The number to get the square root of.
+        file_name: str - File name, usually ending with .jsonl.
 
     Usage:
-        square_root(number)
+        for record in iter_json_lines(file):
 
     Returns:
-        int
+        Generator
     """
-    
-    return sqrt(number)
+    with open(file_name, 'rb') as my_file_raw:
+        for line in my_file_raw:
+            if not line.isspace():
+                yield loads(line)
 
-def true_or_false() -> dict:
+def iter_json_array(file_name: str, chunk_size: int = 1 << 16):
     """
     Info:
-        Returns a dict that contains two list, containing words if its true/false acceptance.
-    
-    Usage:
-        true_or_false()
+        Yields the items of a json file whose top level value is an array one at a time.
+        The file is read in chunks and each item is decoded as soon as it is complete, so only about one item is held in memory.
+        An item touching the end of what was read, or a number followed by more number characters like the 1 of a split 1.5, is decoded again once more of the file is read.
 
-    Returns:
-        dict
+    Paramaters:
+        file_name: str - File name, ending with .json.
+        [Optional]chunk_size: int -> 65536 - Amount of characters read at once.
+
+    Usage:
+        for item in iter_json_array(file):
+
+    Returns:
+        Generator
+    """
+    from json import JSONDecoder, JSONDecodeError
+
+    decode = JSONDecoder().raw_decode
+    with open(file_name, 'r') as my_file_raw:
+        buffer = ''
+        position = 0
+        consumed = 0
+        ended = False
+
+        def fill(size: int) -> bool:
+            nonlocal buffer, position, consumed, ended
+            chunk = my_file_raw.read(size)
+            consumed += position
+            buffer = buffer[position:] + chunk
+            position = 0
+            ended = not chunk
+            return not ended
+
+        def skip_space() -> str:
+            nonlocal position
+            while True:
+                while position < len(buffer) and buffer[position] in ' \t\n\r':
+                    position += 1
+                if position < len(buffer) or not fill(chunk_size):
+                    return buffer[position:position + 1]
+
+        if skip_space() != '[':
+            raise ValueError(f'{file_name} does not hold a json array')
+        position += 1
+
+        if skip_space() == ']':
+            return
+        while True:
+            size = chunk_size
+            while True:
+                try:
+                    item, end = decode(buffer, position)
+                    if ended or end < len(buffer) and not (type(item) in (int, float) and buffer[end] in '.eE+-0123456789'):
+                        break
+                except JSONDecodeError:
+                    if ended:
+                        raise
+                fill(size)
+                size *= 2
+
+            position = end
+            yield item
+
+            separator = skip_space()
+            position += 1
+            if separator == ']':
+                return
+            if separator != ',':
+                raise ValueError(f'Expected , or ] at character {consumed + position - 1} of {file_name}')
+            skip_space()
+
+def iter_yaml(file_name: str):
+    """
+    Info:
+        Yields every document of a multi document yaml file one at a time, using libyaml when it is available.
+
+    Paramaters:
+        file_name: str - File name, ending with .yaml or .yml.
+
+    Usage:
+        for document in iter_yaml(file):
+
+    Returns:
+        Generator
+    """
+    from yaml import load_all
+
+    with open(file_name, 'r') as my_file_raw:
+        yield from load_all(my_file_raw, Loader=_yaml_loader())
+
+def square_root(number: int) -> int:
+    """
+    Info:
+        Returns the square root of a number.
+
+    Paramaters:
+        number: int - The number to get the square root of.
+
+    Usage:
+        square_root(number)
+
+    Returns:
+        int
+    """
+    
+    return sqrt(number)
+
+def true_or_false() -> dict:
+    """
+    Info:
+        Returns a dict that contains two list, containing words if its true/false acceptance.
+    
+    Usage:
+        true_or_false()
+
+    Returns:
+        dict
     """
     
     return {
@@ -694,235 +1546,2770 @@ def true_or_false() -> dict:
             'negative'
         ]}
 
-def scrape_website(url: str) -> str:
+class DownloadTooLarge(Exception):
     """
     Info:
-        Returns the html of a website.
-
-    Paramaters:
-        url: str - The url to fetch and return the html of.
+        Raised by HttpClient.stream when a response is bigger than the max_size it was given.
 
-    Usage:
-        scrape_website(url)
-
-    Returns:
-        str        
+    Attributes:
+        url: str - The url that was being downloaded.
+        max_size: int - The limit in bytes that was passed.
+        size: int - The announced Content-Length or the bytes read when the limit was hit.
     """
-    result = get(url)
-    result_txt = result.text
-    return result_txt
+    def __init__(self, url: str, max_size: int, size: int) -> None:
+        super().__init__(f'{url} is larger than {max_size} bytes ({size} bytes)')
+        self.url = url
+        self.max_size = max_size
+        self.size = size
 
-def get_mean(numbers: list) -> int:
+class HttpCache:
     """
     Info:
-        Gets the mean of a list of ints.
+        Opt-in cache for scraped pages, kept in a memory LRU and optionally in a directory on disk, both with size limits.
+        Entries live for ttl seconds or the max-age the server sends, after that they are revalidated with If-None-Match and If-Modified-Since so an unchanged page only costs a 304.
+        Responses marked no-store are never kept and no-cache ones are revalidated every time.
 
-    Paramaters:
-        numbers: list - The list of numbers to get the mean from.
+    Options:
+        fetch - Returns the html of a website through the cache
+        invalidate - Drops a url from the cache
+        clear - Drops every entry
+        stats - Returns the hit, miss, revalidation and eviction counts
 
     Usage:
-        get_mean(numbers)
-
-    Returns:
-        int
+        cache = HttpCache(ttl=600, path='http_cache')
+        scrape_website(url, cache=cache)
     """
-    return mean(numbers)
 
-def get_median(numbers: list) -> int:
-    """
-    Info:
-        Gets the median of a list of ints.
+    def __init__(self, max_entries: int = 256, max_bytes: int = 64 << 20, ttl: float = 300, path: str = None, disk_max_bytes: int = 512 << 20) -> None:
+        """
+        Info:
+            Creates the cache and indexes the disk store if one is given.
 
-    Paramaters:
-        numbers: list - The list of numbers to get the median from.
+        Paramaters:
+            [Optional]max_entries: int -> 256 - Most pages kept in memory.
+            [Optional]max_bytes: int -> 67108864 - Most characters of html kept in memory.
+            [Optional]ttl: float -> 300 - Seconds a page is served without asking the server, when the server sends no max-age.
+            [Optional]path: str -> None - Directory to also keep pages in, None keeps them in memory only.
+            [Optional]disk_max_bytes: int -> 536870912 - Most bytes the disk store may use.
 
-    Usage:
-        get_median(numbers)
+        Usage:
+            cache = HttpCache()
 
-    Returns:
-        int
-    """
-    return median(numbers)
+        Returns:
+            None
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.path = path
+        self.disk_max_bytes = disk_max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.disk = OrderedDict()
+        self.disk_size = 0
+        self.hits = self.misses = self.revalidations = self.evictions = 0
+        self._lock = RLock()
+
+        if path is not None:
+            makedirs(path, exist_ok=True)
+            files = [entry for entry in scandir(path) if entry.is_file() and not entry.name.endswith('.tmp')]
+            for entry in sorted(files, key=lambda entry: entry.stat().st_mtime):
+                self.disk[entry.name] = entry.stat().st_size
+                self.disk_size += self.disk[entry.name]
+
+    def fetch(self, client: 'HttpClient', url: str) -> str:
+        """
+        Info:
+            Returns the html of a website, from the cache while it is fresh and from the client otherwise.
 
-class Database:
-    """
-    Info: 
-        Cretes a simple database using JSON
+        Paramaters:
+            client: HttpClient - The client to fetch or revalidate with.
+            url: str - The url to fetch and return the html of.
 
-    Options:
-        add - Adds a key and value
-        remove -  Removes a key and value
-        fetch - Fetches a key and value
-        reset - Resets the database
-        update - Updates the database
+        Usage:
+            cache.fetch(client, url)
 
-    Usage:
-        my_databse = Database()
-        my_database.add(key, value)
-    """
-    
-    def __init__(self, create_new_database: bool = True) -> None:
+        Returns:
+            str
+        """
+        entry = self._get(url)
+        if entry is not None and entry[3] > time():
+            with self._lock:
+                self.hits += 1
+            return entry[0]
+
+        headers = {}
+        if entry is not None:
+            if entry[1]:
+                headers['If-None-Match'] = entry[1]
+            if entry[2]:
+                headers['If-Modified-Since'] = entry[2]
+
+        response = client.get(url, headers=headers)
+        if entry is not None and response.status_code == 304:
+            with self._lock:
+                self.revalidations += 1
+            expires = self._expires(response.headers)
+            if expires is not None:
+                self._put(url, [entry[0], response.headers.get('ETag', entry[1]), response.headers.get('Last-Modified', entry[2]), expires])
+            else:
+                self.invalidate(url)
+            return entry[0]
+
+        with self._lock:
+            self.misses += 1
+        text = response.text
+        expires = self._expires(response.headers)
+        if response.status_code == 200 and expires is not None:
+            self._put(url, [text, response.headers.get('ETag'), response.headers.get('Last-Modified'), expires])
+        else:
+            self.invalidate(url)
+        return text
+
+    def invalidate(self, url: str) -> None:
         """
         Info:
-            Creates the database when called
+            Drops a url from memory and from the disk store so the next fetch downloads it again.
 
         Paramaters:
-            create_new_database: bool - Whether or not to rewrite the database.
-        
+            url: str - The url to drop.
+
         Usage:
-            my_database = Database()
-        
+            cache.invalidate(url)
+
         Returns:
             None
         """
-        self.database = {}
-        
-        if create_new_database:
-            self.reset()
-
-        self.load()
-        
-    def add(self, key: str, value: Union[str, int, list, dict, tuple]) -> None:
+        with self._lock:
+            entry = self.entries.pop(url, None)
+            if entry is not None:
+                self.size -= len(entry[0])
+            if self.path is not None:
+                self._remove_file(self._file_name(url))
+
+    def clear(self) -> None:
         """
         Info:
-            Adds a key and value to the database
-
-        Paramaters:
-            key: str- the key of the item
-            value: Union[str, int, list, dict, tuple] - The value of the key
+            Drops every entry from memory and deletes the disk store's files, the stats are kept.
 
         Usage:
-            my_database.add(key, value)
+            cache.clear()
 
         Returns:
             None
         """
-        
-        self.database[key] = value
-        self.update()
+        with self._lock:
+            self.entries.clear()
+            self.size = 0
+            for name in [*self.disk]:
+                self._remove_file(name)
 
-    def remove(self, key: str) -> None:
+    def stats(self) -> dict:
         """
         Info:
-            Removes a key and value from the database
+            Returns the cache counters and how much it holds.
+            hits were served without a request, revalidations were answered with a 304 and misses downloaded the page.
 
-        Paramaters:
-            key: str- the key of the item
-            value: Union[str, int, list, dict, tuple] - The value of the key
+        Usage:
+            cache.stats()
+
+        Returns:
+            dict
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'revalidations': self.revalidations,
+                'evictions': self.evictions,
+                'entries': len(self.entries),
+                'bytes': self.size,
+                'disk_entries': len(self.disk),
+                'disk_bytes': self.disk_size
+            }
+
+    def _expires(self, headers):
+        """
+        Info:
+            Returns when a response stops being fresh from its Cache-Control header, or None when it must not be stored.
 
         Usage:
-            my_database.remove(key, value)
+            self._expires(response.headers)
 
         Returns:
-            None
+            float or None
         """
-        
-        del database[key]
-        self.update()
+        control = [part.strip().lower() for part in headers.get('Cache-Control', '').split(',')]
+        if 'no-store' in control:
+            return None
+        if 'no-cache' in control:
+            return 0
+        for part in control:
+            if part.startswith('max-age='):
+                age = part[8:].strip('"')
+                if age.isdigit():
+                    return time() + int(age)
+        return time() + self.ttl
+
+    def _file_name(self, url: str) -> str:
+        return sha256(url.encode()).hexdigest()
+
+    def _get(self, url: str):
+        with self._lock:
+            entry = self.entries.get(url)
+            if entry is not None:
+                self.entries.move_to_end(url)
+                return entry
+
+            if self.path is None:
+                return None
+            name = self._file_name(url)
+            if name not in self.disk:
+                return None
+            self.disk.move_to_end(name)
 
-    def fetch(self, key: str) -> Union[str, int, list, dict, tuple, None]:
+        try:
+            with open(f'{self.path}/{name}', 'rb') as file:
+                record = marshal_loads(file.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            record = None
+        if not isinstance(record, list) or record[:1] != [url]:
+            with self._lock:
+                self._remove_file(name)
+            return None
+
+        self._remember(url, record[1:])
+        return record[1:]
+
+    def _put(self, url: str, entry: list) -> None:
+        self._remember(url, entry)
+        if self.path is None:
+            return
+
+        name = self._file_name(url)
+        data = marshal_dumps([url, *entry])
+        if len(data) > self.disk_max_bytes:
+            return
+        temp_name = f'{self.path}/{name}.{getpid()}.{id(entry)}.tmp'
+        try:
+            with open(temp_name, 'wb') as file:
+                file.write(data)
+            replace(temp_name, f'{self.path}/{name}')
+        except OSError:
+            try:
+                unlink(temp_name)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            self.disk_size += len(data) - self.disk.pop(name, 0)
+            self.disk[name] = len(data)
+            while self.disk_size > self.disk_max_bytes:
+                self._remove_file(next(iter(self.disk)))
+                self.evictions += 1
+
+    def _remember(self, url: str, entry: list) -> None:
+        with self._lock:
+            old = self.entries.pop(url, None)
+            if old is not None:
+                self.size -= len(old[0])
+            if len(entry[0]) > self.max_bytes:
+                return
+
+            self.entries[url] = entry
+            self.size += len(entry[0])
+            while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+                self.size -= len(self.entries.popitem(last=False)[1][0])
+                self.evictions += 1
+
+    def _remove_file(self, name: str) -> None:
+        self.disk_size -= self.disk.pop(name, 0)
+        try:
+            unlink(f'{self.path}/{name}')
+        except OSError:
+            pass
+
+class HttpClient:
+    """
+    Info:
+        Keeps a pooled requests session so connections to a host are reused between requests instead of paying for a new TCP and TLS handshake each time.
+        Every request gets a timeout and failed connections or 429 and 5xx answers are retried with exponential backoff.
+
+    Options:
+        get - Sends a GET request and returns the response
+        scrape - Returns the html of a website
+        stream - Downloads a response in chunks without holding all of it in memory
+        close - Closes the pooled connections
+
+    Usage:
+        with HttpClient(pool_size=20) as client:
+            client.scrape(url)
+    """
+
+    def __init__(self, pool_size: int = 10, hosts: int = 10, timeout: float = 30, retries: int = 3, backoff: float = 0.5, headers: dict = None, cache: HttpCache = None) -> None:
         """
         Info:
-            Fetches the keys item and returns it
+            Creates the session and its connection pools.
 
         Paramaters:
-            key: str - The key to fetch and return
+            [Optional]pool_size: int -> 10 - Connections kept open per host.
+            [Optional]hosts: int -> 10 - Amount of hosts to keep a pool for.
+            [Optional]timeout: float -> 30 - Seconds to wait to connect and between bytes, None waits forever.
+            [Optional]retries: int -> 3 - Amount of times to retry a failed request.
+            [Optional]backoff: float -> 0.5 - Base of the exponential wait between retries in seconds.
+            [Optional]headers: dict -> None - Headers sent with every request.
+            [Optional]cache: HttpCache -> None - Cache scrape goes through, None always downloads.
 
         Usage:
-            my_database.fetch(key)
+            client = HttpClient()
 
         Returns:
-            Union[str, int, list, dict, tuple]
+            None
         """
-        
-        try:
-            return self.database[key]
-        except Exception:
-            return None
+        from requests import Session
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
 
-    def reset(self) -> None:
+        self.timeout = timeout
+        self.cache = cache
+        self.session = Session()
+        if headers:
+            self.session.headers.update(headers)
+
+        retry = Retry(total=retries, backoff_factor=backoff, status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=hosts, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def __enter__(self) -> 'HttpClient':
+        return self
+
+    def __exit__(self, *error) -> None:
+        self.close()
+
+    def get(self, url: str, **kwargs):
         """
         Info:
-            Resets the database
+            Sends a GET request through the pool and returns the response.
+
+        Paramaters:
+            url: str - The url to fetch.
+            kwargs - Passed to requests, timeout defaults to the client's timeout.
 
         Usage:
-            my_database.reset()
+            client.get(url)
 
         Returns:
-            None
+            requests.Response
         """
-        
-        self.database = {}
-        self.update()
-    
-    def update(self) -> None:
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session.get(url, **kwargs)
+
+    def scrape(self, url: str, cache: HttpCache = None) -> str:
         """
         Info:
-            Updates the database
+            Returns the html of a website.
+
+        Paramaters:
+            url: str - The url to fetch and return the html of.
+            [Optional]cache: HttpCache -> None - Cache to go through, None uses the client's own cache if it has one.
 
         Usage:
-            my_database.update()
+            client.scrape(url)
 
         Returns:
-            None
+            str
         """
-        
-        with open('database.json', 'w') as my_file:
-            dump(self.database, my_file)
+        cache = cache or self.cache
+        if cache is not None:
+            return cache.fetch(self, url)
+        return self.get(url).text
 
-    def load(self) -> None:
+    def stream(self, url: str, sink=None, chunk_size: int = 1 << 16, max_size: int = None):
         """
         Info:
-            Loads the database
+            Downloads a response in chunks of at most chunk_size bytes so memory stays flat no matter how big the body is.
+            Without a sink the chunks are yielded, with one they are written to it and the amount of bytes written is returned.
+            When max_size is given the download stops with DownloadTooLarge as soon as the Content-Length or the bytes read go over it.
+
+        Paramaters:
+            url: str - The url to download.
+            [Optional]sink: str | file -> None - A path or a binary file-like object with a write method, None yields the chunks.
+            [Optional]chunk_size: int -> 65536 - Most bytes read and held at once.
+            [Optional]max_size: int -> None - Most bytes to accept, None accepts any size.
 
         Usage:
-            my_database.load()
+            for chunk in client.stream(url):
+            client.stream(url, 'page.html', max_size=1 << 30)
 
         Returns:
-            None
+            Generator - bytes chunks, or int - bytes written when a sink is given.
         """
-        
-        with open('database.json', 'r') as my_file:
-            self.database = json_load(my_file)
+        chunks = self._stream(url, chunk_size, max_size)
+        if sink is None:
+            return chunks
+
+        if not isinstance(sink, str):
+            return self._write_chunks(chunks, sink)
+
+        temp_name = sink + '.tmp'
+        try:
+            with open(temp_name, 'wb', buffering=0) as file:
+                written = self._write_chunks(chunks, file)
+            replace(temp_name, sink)
+        except BaseException:
+            try:
+                unlink(temp_name)
+            except OSError:
+                pass
+            raise
+        return written
 
-def hash_item(item: Union[str, bytes]) -> bytes:
+    @staticmethod
+    def _write_chunks(chunks, file) -> int:
+        written = 0
+        try:
+            for chunk in chunks:
+                file.write(chunk)
+                written += len(chunk)
+        finally:
+            chunks.close()
+        return written
+
+    def _stream(self, url: str, chunk_size: int, max_size: int):
+        with self.get(url, stream=True) as response:
+            response.raise_for_status()
+            length = response.headers.get('Content-Length')
+            if max_size is not None and length and length.isdigit() and int(length) > max_size:
+                raise DownloadTooLarge(url, max_size, int(length))
+
+            read = 0
+            for chunk in response.iter_content(chunk_size):
+                read += len(chunk)
+                if max_size is not None and read > max_size:
+                    raise DownloadTooLarge(url, max_size, read)
+                yield chunk
+
+    def close(self) -> None:
+        self.session.close()
+
+_http_client = None
+_http_client_lock = RLock()
+
+def _default_http_client() -> HttpClient:
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = HttpClient()
+    return _http_client
+
+def scrape_website(url: str, client: HttpClient = None, stream: bool = False, sink=None, chunk_size: int = 1 << 16, max_size: int = None, cache: HttpCache = None):
     """
     Info:
-        Hashes the given string and returns the hash in bytes
+        Returns the html of a website.
+        Requests go through a shared HttpClient so connections are kept alive between calls.
+        With stream or a sink the body is downloaded in chunks instead, see HttpClient.stream.
 
     Paramaters:
-        item: Union[str, bytes] - The item to hash
-    
+        url: str - The url to fetch and return the html of.
+        [Optional]client: HttpClient -> None - The client to fetch with, None uses the shared one.
+        [Optional]stream: bool -> False - Yields the body as bytes chunks instead of returning the html.
+        [Optional]sink: str | file -> None - A path or binary file-like object to write the body to, returns the bytes written.
+        [Optional]chunk_size: int -> 65536 - Most bytes held at once when streaming.
+        [Optional]max_size: int -> None - Raises DownloadTooLarge when a streamed body is bigger, None accepts any size.
+        [Optional]cache: HttpCache -> None - Cache to serve the html from, None uses the client's cache if it has one. Streamed downloads are never cached.
+
     Usage:
-        hash_item(item)
+        scrape_website(url)
+        scrape_website(url, sink='file.zip', max_size=1 << 30)
+        scrape_website(url, cache=HttpCache(ttl=600))
 
     Returns:
-        bytes
+        str, Generator or int        
     """
-    
-    return sha256(item.encode()).hexdigest()
+    client = client or _default_http_client()
+    if stream or sink is not None:
+        return client.stream(url, sink, chunk_size, max_size)
+    return client.scrape(url, cache)
+
+def scrape_many(urls: list, workers: int = 10, per_host: int = 4, client: HttpClient = None):
+    """
+    Info:
+        Fetches many websites at once on a thread pool and yields each one as soon as it finishes.
+        At most workers requests run in total and at most per_host against the same host, a failing url does not stop the others.
+
+    Paramaters:
+        urls: list - The urls to fetch.
+        [Optional]workers: int -> 10 - Most requests running at the same time.
+        [Optional]per_host: int -> 4 - Most requests running against one host at the same time, keep it at or below the client's pool_size.
+        [Optional]client: HttpClient -> None - The client to fetch with, None uses the shared one.
+
+    Usage:
+        for url, html, error in scrape_many(urls):
 
+    Returns:
+        Generator - (url, html, error) tuples, html is None when error is set.
+    """
+    from urllib.parse import urlsplit
+    from concurrent.futures import wait, FIRST_COMPLETED
+
+    client = client or _default_http_client()
+    queued = {}
+    for url in urls:
+        queued.setdefault(urlsplit(url).netloc, deque()).append(url)
+    hosts = deque(queued)
+    active = dict.fromkeys(queued, 0)
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while hosts or running:
+            waiting = 0
+            while hosts and len(running) < workers and waiting < len(hosts):
+                host = hosts[0]
+                hosts.rotate(-1)
+                if active[host] >= per_host:
+                    waiting += 1
+                    continue
+
+                url = queued[host].popleft()
+                if not queued[host]:
+                    hosts.remove(host)
+                active[host] += 1
+                running[pool.submit(client.scrape, url)] = (url, host)
+                waiting = 0
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                url, host = running.pop(future)
+                active[host] -= 1
+                try:
+                    yield url, future.result(), None
+                except Exception as error:
+                    yield url, None, error
+
+def _number_kinds(numbers) -> set:
+    return set(map(type, numbers))
 
-def call_js_function(file: str, function: str, args: tuple = ()) -> Union[str, int, float, dict, list, tuple, Callable]:
+def get_mean(numbers: list) -> int:
     """
     Info:
-        Calls a javascript function in a js file.
-    
+        Gets the mean of a list of ints.
+        Lists of plain ints and floats skip statistics' exact fraction math, ints are summed exactly and floats with fsum.
+        When fsum overflows or meets infinities of both signs the list goes through statistics.mean instead.
+        Numpy arrays are averaged by numpy, anything else like Decimal or Fraction still goes through statistics.mean.
+
     Paramaters:
-        file: str - The js file to use.
-        function: str - The function to call.
-        args: tuple - Arguments to pass to the function.
-        requirements: list - Requirements that the js file needs to run.
+        numbers: list - The list of numbers to get the mean from.
 
     Usage:
-        call_js_function(file, function, args=(arg1,))
-  
+        get_mean(numbers)
+
     Returns:
-       Union[str, int, float, dict, list, tuple, Callable]
+        int or float
     """
-    
-    eval_result, js_function = run_file(file)
-    result = js_function[function](*args)
-    
-    return result
+    numpy = modules.get('numpy')
+    if numpy is not None and isinstance(numbers, numpy.ndarray) and numbers.size:
+        return numbers.mean().item()
+
+    if not isinstance(numbers, (list, tuple, array)):
+        numbers = [*numbers]
+    kinds = _number_kinds(numbers)
+    if numbers and kinds <= {int, bool}:
+        total = sum(numbers)
+        quotient, remainder = divmod(total, len(numbers))
+        return quotient if not remainder else total / len(numbers)
+    if numbers and kinds <= {int, bool, float}:
+        try:
+            return fsum(numbers) / len(numbers)
+        except (OverflowError, ValueError):
+            pass
+
+    from statistics import mean
+
+    return mean(numbers)
+
+def _select(numbers: list, index: int):
+    """
+    Info:
+        Returns the item that would be at index if numbers were sorted, without sorting them.
+        Quickselect around random pivots, each round keeps only the side holding index so it runs in linear time on average.
+
+    Paramaters:
+        numbers: list - The numbers to select from, they are not changed.
+        index: int - Position in sorted order.
+
+    Usage:
+        _select(numbers, len(numbers) // 2)
+
+    Returns:
+        The selected number
+    """
+    from random import choice
+
+    while len(numbers) > 64:
+        pivot = choice(numbers)
+        lower = [number for number in numbers if number < pivot]
+        if index < len(lower):
+            numbers = lower
+            continue
+
+        index -= len(lower)
+        higher = [number for number in numbers if number > pivot]
+        equal = len(numbers) - len(lower) - len(higher)
+        if index < equal:
+            return pivot
+        index -= equal
+        numbers = higher
+    return sorted(numbers)[index]
+
+def get_median(numbers: list) -> int:
+    """
+    Info:
+        Gets the median of a list of ints.
+        Lists of plain ints and floats are not fully sorted, the middle is found with quickselect, numpy arrays use numpy's partition based median.
+
+    Paramaters:
+        numbers: list - The list of numbers to get the median from.
+
+    Usage:
+        get_median(numbers)
+
+    Returns:
+        int or float
+    """
+    numpy = modules.get('numpy')
+    if numpy is not None and isinstance(numbers, numpy.ndarray) and numbers.size:
+        return numpy.median(numbers).item()
+
+    if not isinstance(numbers, (list, tuple, array)):
+        numbers = [*numbers]
+    if len(numbers) <= 64 or not _number_kinds(numbers) <= {int, bool, float}:
+        from statistics import median
+
+        return median(numbers)
+
+    middle = len(numbers) // 2
+    higher = _select(numbers, middle)
+    if len(numbers) % 2:
+        return higher
+
+    lower = [number for number in numbers if number < higher]
+    return ((max(lower) if len(lower) == middle else higher) + higher) / 2
+
+class RunningStats:
+    """
+    Info:
+        Keeps the count, mean, variance, min and max of a stream of numbers in constant memory with Welford's algorithm.
+        Two of them can be merged, so parts of a stream can be summarized separately and combined.
+
+    Options:
+        add - Adds a number
+        extend - Adds every number of an iterable
+        merge - Adds the numbers another RunningStats has seen
+        variance - Returns the sample or population variance
+        stdev - Returns the sample or population standard deviation
+
+    Usage:
+        stats = RunningStats()
+        stats.extend(numbers)
+        stats.mean, stats.stdev()
+    """
+
+    def __init__(self, numbers=()) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.min = None
+        self.max = None
+        self._squares = 0.0
+        self.extend(numbers)
+
+    def add(self, number: float) -> None:
+        """
+        Info:
+            Adds a number to the summary.
+
+        Paramaters:
+            number: float - The number to add.
+
+        Usage:
+            stats.add(number)
+
+        Returns:
+            None
+        """
+        self.count += 1
+        delta = number - self.mean
+        self.mean += delta / self.count
+        self._squares += delta * (number - self.mean)
+        if self.min is None or number < self.min:
+            self.min = number
+        if self.max is None or number > self.max:
+            self.max = number
+
+    def extend(self, numbers) -> None:
+        """
+        Info:
+            Adds every number of an iterable to the summary, one at a time so the iterable can be unbounded.
+
+        Paramaters:
+            numbers: Iterable - The numbers to add.
+
+        Usage:
+            stats.extend(numbers)
+
+        Returns:
+            None
+        """
+        add = self.add
+        for number in numbers:
+            add(number)
+
+    def merge(self, other: 'RunningStats') -> None:
+        """
+        Info:
+            Adds everything another summary has seen as if its numbers were added here.
+
+        Paramaters:
+            other: RunningStats - The summary to merge in.
+
+        Usage:
+            stats.merge(other)
+
+        Returns:
+            None
+        """
+        if not other.count:
+            return
+        if not self.count:
+            self.count, self.mean, self._squares, self.min, self.max = other.count, other.mean, other._squares, other.min, other.max
+            return
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self._squares += other._squares + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def variance(self, sample: bool = True) -> float:
+        """
+        Info:
+            Returns the variance of the numbers seen so far.
+
+        Paramaters:
+            [Optional]sample: bool -> True - Divides by count - 1 like statistics.variance, False divides by count like statistics.pvariance.
+
+        Usage:
+            stats.variance()
+
+        Returns:
+            float
+        """
+        if self.count < 1 + sample:
+            from statistics import StatisticsError
+            raise StatisticsError(f'variance requires at least {1 + sample} data points')
+        return self._squares / (self.count - sample)
+
+    def stdev(self, sample: bool = True) -> float:
+        """
+        Info:
+            Returns the standard deviation of the numbers seen so far.
+
+        Paramaters:
+            [Optional]sample: bool -> True - Uses the sample variance like statistics.stdev, False uses the population variance like statistics.pstdev.
+
+        Usage:
+            stats.stdev()
+
+        Returns:
+            float
+        """
+        return sqrt(self.variance(sample))
+
+class RunningQuantile:
+    """
+    Info:
+        Estimates a quantile of a stream of numbers in constant memory with the P-square algorithm.
+        Only five markers are kept, the estimate is exact for the first five numbers and usually within a fraction of a percent after that.
+
+    Options:
+        add - Adds a number
+        extend - Adds every number of an iterable
+        value - Returns the current estimate
+
+    Usage:
+        p99 = RunningQuantile(0.99)
+        p99.extend(latencies)
+        p99.value()
+    """
+
+    def __init__(self, quantile: float = 0.5, numbers=()) -> None:
+        """
+        Info:
+            Creates the estimator.
+
+        Paramaters:
+            [Optional]quantile: float -> 0.5 - The quantile to track, between 0 and 1.
+            [Optional]numbers: Iterable -> () - Numbers to add right away.
+
+        Usage:
+            RunningQuantile(0.95)
+
+        Returns:
+            None
+        """
+        if not 0 <= quantile <= 1:
+            raise ValueError('quantile must be between 0 and 1')
+
+        self.quantile = quantile
+        self.count = 0
+        self._heights = []
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0, 2 * quantile, 4 * quantile, 2 + 2 * quantile, 4]
+        self._steps = [0, quantile / 2, quantile, (1 + quantile) / 2, 1]
+        self.extend(numbers)
+
+    def add(self, number: float) -> None:
+        """
+        Info:
+            Adds a number and moves the markers towards their desired positions.
+
+        Paramaters:
+            number: float - The number to add.
+
+        Usage:
+            p99.add(number)
+
+        Returns:
+            None
+        """
+        self.count += 1
+        heights = self._heights
+        if self.count <= 5:
+            heights.append(number)
+            heights.sort()
+            return
+
+        positions = self._positions
+        if number < heights[0]:
+            heights[0] = number
+            cell = 0
+        elif number >= heights[4]:
+            heights[4] = number
+            cell = 3
+        else:
+            cell = bisect_right(heights, number, 1, 4) - 1
+
+        for marker in range(cell + 1, 5):
+            positions[marker] += 1
+        for marker in range(5):
+            self._desired[marker] += self._steps[marker]
+
+        for marker in (1, 2, 3):
+            offset = self._desired[marker] - positions[marker]
+            if (offset >= 1 and positions[marker + 1] - positions[marker] > 1) or (offset <= -1 and positions[marker - 1] - positions[marker] < -1):
+                step = 1 if offset > 0 else -1
+                height = heights[marker] + step / (positions[marker + 1] - positions[marker - 1]) * (
+                    (positions[marker] - positions[marker - 1] + step) * (heights[marker + 1] - heights[marker]) / (positions[marker + 1] - positions[marker])
+                    + (positions[marker + 1] - positions[marker] - step) * (heights[marker] - heights[marker - 1]) / (positions[marker] - positions[marker - 1])
+                )
+                if not heights[marker - 1] < height < heights[marker + 1]:
+                    height = heights[marker] + step * (heights[marker + step] - heights[marker]) / (positions[marker + step] - positions[marker])
+                heights[marker] = height
+                positions[marker] += step
+
+    def extend(self, numbers) -> None:
+        """
+        Info:
+            Adds every number of an iterable to the estimate, one at a time so the iterable can be unbounded.
+
+        Paramaters:
+            numbers: Iterable - The numbers to add.
+
+        Usage:
+            p99.extend(numbers)
+
+        Returns:
+            None
+        """
+        add = self.add
+        for number in numbers:
+            add(number)
+
+    def value(self) -> float:
+        """
+        Info:
+            Returns the current estimate of the quantile, interpolated between the numbers while fewer than six were added.
+
+        Usage:
+            p99.value()
+
+        Returns:
+            float
+        """
+        if not self.count:
+            from statistics import StatisticsError
+            raise StatisticsError('no data points')
+        if self.count > 5:
+            return self._heights[2]
+
+        position = self.quantile * (self.count - 1)
+        below = int(position)
+        above = min(below + 1, self.count - 1)
+        return self._heights[below] + (self._heights[above] - self._heights[below]) * (position - below)
+
+_MISSING = object()
+_SNAPSHOT_MAGIC = b'DPDB'
+_SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = Struct('<4sBQQQQ')
+_SNAPSHOT_LENGTH = Struct('<I')
+_SNAPSHOT_BLOCK_SIZE = 4096
+
+@contextmanager
+def _gc_paused():
+    """
+    Info:
+        Turns the garbage collector off inside the with block, building millions of containers otherwise triggers it over and over.
+
+    Usage:
+        with _gc_paused():
+
+    Returns:
+        None
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+class _IndexedStore(MutableMapping):
+    """
+    Info:
+        Dict like view of an append only data file, only a key to (offset, length) index is kept in memory.
+        Values are decoded from a memory map of the file when fetched and the most recently used ones are kept in a small cache.
+        Values that are set but not written yet live in memory until write is called with their records, the index entry they replace is kept aside so the saved index always matches the file.
+        Reads take no lock, if the file was compacted under a reader it retries while holding the given lock.
+
+    Usage:
+        _IndexedStore(file_name, cache_size, sync, lock)
+    """
+    def __init__(self, file_name: str, cache_size: int = 1024, sync: bool = True, lock: RLock = None) -> None:
+        self.file_name = file_name
+        self.index_name = f'{file_name}.index'
+        self.cache_size = cache_size
+        self.sync = sync
+        self.lock = lock or RLock()
+        self.index = {}
+        self.dirty = {}
+        self.shadowed = {}
+        self.cache = OrderedDict()
+        self.live_size = 0
+        self._file = open(file_name, 'ab')
+        self._size = self._file.tell()
+        self._map = None
+        self._load_index()
+
+    def __getitem__(self, key: str):
+        if key in self.dirty:
+            return self.dirty[key]
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+
+        try:
+            record = self._read(*self.index[key])
+        except ValueError:
+            record = None
+        if not isinstance(record, list) or record[1:2] != [key]:
+            with self.lock:
+                if key in self.dirty:
+                    return self.dirty[key]
+                record = self._read(*self.index[key])
+
+        self._cache(key, record[2])
+        return record[2]
+
+    def __setitem__(self, key: str, value) -> None:
+        self.shadowed.setdefault(key, self.index.get(key))
+        self.dirty[key] = value
+        self.cache.pop(key, None)
+        self.index.setdefault(key, None)
+
+    def __delitem__(self, key: str) -> None:
+        self.shadowed.setdefault(key, self.index.get(key))
+        entry = self.index.pop(key)
+        if entry:
+            self.live_size -= entry[1]
+        self.dirty.pop(key, None)
+        self.cache.pop(key, None)
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
+
+    def write(self, records: list) -> None:
+        """
+        Info:
+            Appends the records to the data file and points the index at them.
+
+        Paramaters:
+            records: list - The changes, as ['add', key, value] or ['remove', key].
+
+        Usage:
+            store.write(records)
+
+        Returns:
+            None
+        """
+        lines = [f'{dumps(record, separators=(",", ":"))}\n'.encode() for record in records]
+        data = b''.join(lines)
+        self._file.write(data)
+        self._file.flush()
+        if self.sync:
+            fsync(self._file.fileno())
+
+        offset = self._file.tell() - len(data)
+        for record, line in zip(records, lines):
+            self.shadowed.pop(record[1], None)
+            if record[0] == 'add':
+                self._point(record[1], offset, len(line))
+                self.dirty.pop(record[1], None)
+                self._cache(record[1], record[2])
+            elif record[1] in self.index:
+                self.live_size -= (self.index.pop(record[1]) or (0, 0))[1]
+            offset += len(line)
+        self._size = offset
+
+    def compact(self) -> None:
+        """
+        Info:
+            Rewrites the data file with only the latest value of each key and saves the index.
+
+        Usage:
+            store.compact()
+
+        Returns:
+            None
+        """
+        temporary_name = f'{self.file_name}.tmp'
+        index = {}
+        offset = 0
+        with open(temporary_name, 'wb') as new_file:
+            for key in self.index:
+                if self.index[key] and key not in self.dirty:
+                    start, length = self.index[key]
+                    line = self._mapped(start + length)[start:start + length]
+                else:
+                    line = f'{dumps(["add", key, self[key]], separators=(",", ":"))}\n'.encode()
+                new_file.write(line)
+                index[key] = (offset, len(line))
+                offset += len(line)
+            new_file.flush()
+            fsync(new_file.fileno())
+
+        self._close_file()
+        replace(temporary_name, self.file_name)
+        self._file = open(self.file_name, 'ab')
+        self.index, self.dirty, self.shadowed, self._size, self.live_size = index, {}, {}, offset, offset
+        self.save_index()
+
+    def refresh(self) -> bool:
+        """
+        Info:
+            Picks up records other processes appended to the data file, or reopens it if another process compacted it.
+            Values set or removed here but not written yet stay as they are.
+
+        Usage:
+            store.refresh()
+
+        Returns:
+            bool - Whether anything changed.
+        """
+        source = stat(self.file_name)
+        if fstat(self._file.fileno()).st_ino == source.st_ino and source.st_size >= self._size:
+            return self._scan(self._size)
+
+        removed = [key for key in self.shadowed if key not in self.index]
+        self._close_file()
+        self._file = open(self.file_name, 'ab')
+        self._size = self._file.tell()
+        self.index, self.shadowed, self.live_size = {}, {}, 0
+        self.cache.clear()
+        self._load_index()
+
+        for key in removed:
+            if key in self.index:
+                del self[key]
+        for key, value in [*self.dirty.items()]:
+            self[key] = value
+        return True
+
+    def should_compact(self, compact_size: int) -> bool:
+        return self._size > compact_size and self._size > self.live_size * 2
+
+    def clear(self) -> None:
+        temporary_name = f'{self.file_name}.tmp'
+        open(temporary_name, 'wb').close()
+        self._close_file()
+        replace(temporary_name, self.file_name)
+        self._file = open(self.file_name, 'ab')
+        self._size = self.live_size = 0
+        self.index, self.dirty, self.shadowed = {}, {}, {}
+        self.cache.clear()
+        self.save_index()
+
+    def save_index(self) -> None:
+        """
+        Info:
+            Saves the index next to the data file so the next open only has to read records written after it.
+
+        Usage:
+            store.save_index()
+
+        Returns:
+            None
+        """
+        entries = [[key, *entry] for key, entry in self.index.items() if entry and key not in self.shadowed]
+        entries += [[key, *entry] for key, entry in self.shadowed.items() if entry]
+        temporary_name = f'{self.index_name}.tmp'
+        with open(temporary_name, 'w') as index_file:
+            dump({'inode': fstat(self._file.fileno()).st_ino, 'size': self._size, 'keys': entries}, index_file)
+        replace(temporary_name, self.index_name)
+
+    def close(self) -> None:
+        self.save_index()
+        self._close_file()
+
+    def _point(self, key: str, offset: int, length: int) -> None:
+        entry = self.index.get(key)
+        if entry:
+            self.live_size -= entry[1]
+        self.index[key] = (offset, length)
+        self.live_size += length
+
+    def _cache(self, key: str, value) -> None:
+        if self.cache_size:
+            self.cache[key] = value
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
+    def _load_index(self) -> None:
+        """
+        Info:
+            Loads the saved index if it still matches the data file, then scans the records written after it.
+            A torn record at the end of the file is cut off.
+
+        Usage:
+            self._load_index()
+
+        Returns:
+            None
+        """
+        start = 0
+        try:
+            with open(self.index_name, 'r') as index_file:
+                saved = json_load(index_file)
+            if saved['inode'] == fstat(self._file.fileno()).st_ino and saved['size'] <= self._size:
+                for key, offset, length in saved['keys']:
+                    self._point(key, offset, length)
+                start = saved['size']
+        except (FileNotFoundError, ValueError, KeyError):
+            pass
+
+        self._scan(start)
+
+    def _scan(self, start: int) -> bool:
+        """
+        Info:
+            Indexes the records from start to the end of the data file and cuts off a torn record at the end.
+            Records for keys with unwritten changes only update the entry kept aside for them.
+
+        Paramaters:
+            start: int - Byte offset to start scanning from.
+
+        Usage:
+            self._scan(start)
+
+        Returns:
+            bool - Whether any record was found.
+        """
+        offset = start
+        with open(self.file_name, 'rb') as data_file:
+            data_file.seek(start)
+            for line in data_file:
+                try:
+                    record = loads(line)
+                except ValueError:
+                    break
+                if not line.endswith(b'\n'):
+                    break
+
+                key = record[1]
+                self.cache.pop(key, None)
+                if key in self.shadowed:
+                    self.shadowed[key] = (offset, len(line)) if record[0] == 'add' else None
+                elif record[0] == 'add':
+                    self._point(key, offset, len(line))
+                elif key in self.index:
+                    self.live_size -= self.index.pop(key)[1]
+                offset += len(line)
+
+        if offset < getsize(self.file_name):
+            self._file.truncate(offset)
+        self._size = offset
+        return offset > start
+
+    def _read(self, offset: int, length: int) -> list:
+        return loads(self._mapped(offset + length)[offset:offset + length])
+
+    def _mapped(self, size: int) -> mmap:
+        """
+        Info:
+            Returns a memory map of the data file that is at least size bytes long, mapping it again if it grew.
+            Old maps are left for the garbage collector so readers still holding one are not cut off.
+
+        Paramaters:
+            size: int - The size the map needs to cover.
+
+        Usage:
+            self._mapped(size)
+
+        Returns:
+            mmap
+        """
+        mapped = self._map
+        if mapped is None or size > len(mapped):
+            with open(self.file_name, 'rb') as data_file:
+                mapped = self._map = mmap(data_file.fileno(), 0, access=ACCESS_READ)
+        return mapped
+
+    def _close_map(self) -> None:
+        self._map = None
+
+    def _close_file(self) -> None:
+        self._close_map()
+        self._file.close()
+
+class _SortedKeys:
+    """
+    Info:
+        Keeps keys sorted in blocks of a few hundred so adding or removing one only shifts its block and lookups are a bisect.
+
+    Usage:
+        _SortedKeys(keys)
+    """
+    block_size = 512
+
+    def __init__(self, keys=()) -> None:
+        keys = sorted(keys)
+        self.blocks = [keys[index:index + self.block_size] for index in range(0, len(keys), self.block_size)]
+        self.maxes = [block[-1] for block in self.blocks]
+
+    def add(self, key: str) -> None:
+        if not self.blocks:
+            self.blocks, self.maxes = [[key]], [key]
+            return
+
+        index = min(bisect_left(self.maxes, key), len(self.maxes) - 1)
+        block = self.blocks[index]
+        position = bisect_left(block, key)
+        if position < len(block) and block[position] == key:
+            return
+
+        block.insert(position, key)
+        self.maxes[index] = block[-1]
+        if len(block) > self.block_size * 2:
+            self.blocks[index:index + 1] = [block[:self.block_size], block[self.block_size:]]
+            self.maxes[index:index + 1] = [block[self.block_size - 1], block[-1]]
+
+    def discard(self, key: str) -> None:
+        index = bisect_left(self.maxes, key)
+        if index == len(self.maxes):
+            return
+
+        block = self.blocks[index]
+        position = bisect_left(block, key)
+        if position < len(block) and block[position] == key:
+            del block[position]
+            if block:
+                self.maxes[index] = block[-1]
+            else:
+                del self.blocks[index], self.maxes[index]
+
+    def iterate(self, start: str = None, end: str = None, include_start: bool = True):
+        """
+        Info:
+            Yields the keys from start up to but not including end in order.
+
+        Paramaters:
+            [Optional]start: str -> None - The first key, None starts at the smallest one.
+            [Optional]end: str -> None - The key to stop before, None goes to the end.
+            [Optional]include_start: bool -> True - If false, skips start itself.
+
+        Usage:
+            keys.iterate(start, end)
+
+        Returns:
+            Generator
+        """
+        find = bisect_left if include_start else bisect_right
+        index = 0 if start is None else find(self.maxes, start)
+
+        for number, block in enumerate(self.blocks[index:]):
+            position = find(block, start) if number == 0 and start is not None else 0
+            for key in block[position:]:
+                if end is not None and key >= end:
+                    return
+                yield key
+
+class Database:
+    """
+    Info: 
+        Cretes a simple database using JSON
+        In journal mode every change is appended to a .log file next to the database instead of rewriting it, the log is replayed on load and folded back into the database once it grows past compact_size.
+        In indexed mode the file at path is an append only log and only an index of where each key's value is lives in memory, values are read from the file when fetched.
+        snapshot writes a binary copy of the database that load reads instead of the JSON file while the JSON file has not changed.
+        Writes are locked between threads and, where fcntl is available, between processes through a .lock file. Before writing, changes other processes made are read in so none are lost, fetch never waits for a lock.
+        scan and range walk the keys in sorted order, the sorted keys are built on first use and kept up to date after that.
+
+    Options:
+        add - Adds a key and value
+        remove -  Removes a key and value
+        fetch - Fetches a key and value
+        scan - Fetches the keys and values under a prefix
+        range - Fetches the keys and values between two keys
+        reset - Resets the database
+        update - Updates the database
+        compact - Folds the journal into the database file
+        snapshot - Writes a binary snapshot for faster loading
+        batch - Groups changes into one write
+        transaction - Same as batch
+        flush - Writes any buffered changes
+        refresh - Reads in changes other processes made
+        close - Writes buffered changes and closes the journal
+
+    Usage:
+        my_databse = Database()
+        my_database.add(key, value)
+    """
+    
+    def __init__(self, create_new_database: bool = True, journal: bool = False, compact_size: int = 1 << 20, sync: bool = True, flush_every: int = None, flush_interval: float = None, path: str = 'database.json', indexed: bool = False, cache_size: int = 1024) -> None:
+        """
+        Info:
+            Creates the database when called
+
+        Paramaters:
+            create_new_database: bool - Whether or not to rewrite the database.
+            [Optional]journal: bool -> False - If true, appends changes to a log file instead of rewriting the whole database.
+            [Optional]compact_size: int -> 1048576 - Bytes the log can grow to, and past the size of the database file, before it is compacted.
+            [Optional]sync: bool -> True - If true, flushes each write to disk before returning.
+            [Optional]flush_every: int -> None - If given, buffers changes and writes them once this many are waiting.
+            [Optional]flush_interval: float -> None - If given, buffers changes and writes them at most this many seconds after the first one.
+            [Optional]path: str -> 'database.json' - The file to store the database in.
+            [Optional]indexed: bool -> False - If true, keeps only a key index in memory and reads values from the file when fetched.
+            [Optional]cache_size: int -> 1024 - Amount of fetched values kept in memory in indexed mode.
+        
+        Usage:
+            my_database = Database()
+            my_database = Database(journal=True)
+            my_database = Database(path='my_database.db', indexed=True)
+        
+        Returns:
+            None
+        """
+        self.database = {}
+        self.file_name = path
+        self.indexed = indexed
+        self.cache_size = cache_size
+        self.journal = journal
+        self.journal_name = f'{self.file_name}.log'
+        self.snapshot_name = f'{self.file_name}.snapshot'
+        self.lock_name = f'{self.file_name}.lock'
+        self.compact_size = compact_size
+        self.sync = sync
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._journal_file = None
+        self._journal_size = 0
+        self._lock = RLock()
+        self._lock_file = None
+        self._lock_depth = 0
+        self._source = None
+        self._keys = None
+        self._pending = []
+        self._undo = []
+        self._flush_timer = None
+        self._flush_error = None
+        
+        if create_new_database:
+            self.reset()
+
+        self.load()
+        
+    def add(self, key: str, value: Union[str, int, list, dict, tuple]) -> None:
+        """
+        Info:
+            Adds a key and value to the database
+
+        Paramaters:
+            key: str- the key of the item
+            value: Union[str, int, list, dict, tuple] - The value of the key
+
+        Usage:
+            my_database.add(key, value)
+
+        Returns:
+            None
+        """
+        
+        with self._lock:
+            self._remember(key)
+            self._set(key, value)
+            self._commit(['add', key, value])
+
+    def remove(self, key: str) -> None:
+        """
+        Info:
+            Removes a key and value from the database
+
+        Paramaters:
+            key: str- the key of the item
+
+        Usage:
+            my_database.remove(key)
+
+        Returns:
+            None
+        """
+        
+        with self._lock:
+            if key not in self.database:
+                raise KeyError(key)
+            self._remember(key)
+            self._discard(key)
+            self._commit(['remove', key])
+
+    def fetch(self, key: str) -> Union[str, int, list, dict, tuple, None]:
+        """
+        Info:
+            Fetches the keys item and returns it
+
+        Paramaters:
+            key: str - The key to fetch and return
+
+        Usage:
+            my_database.fetch(key)
+
+        Returns:
+            Union[str, int, list, dict, tuple]
+        """
+        
+        try:
+            return self.database[key]
+        except Exception:
+            return None
+
+    def scan(self, prefix: str = '', limit: int = None, after: str = None) -> list:
+        """
+        Info:
+            Fetches every key starting with the prefix and its value, in key order.
+            Pass the last key of a page as after to get the next page.
+
+        Paramaters:
+            [Optional]prefix: str -> '' - The prefix the keys start with.
+            [Optional]limit: int -> None - Most items to return, None returns all of them.
+            [Optional]after: str -> None - Only returns keys after this one.
+
+        Usage:
+            my_database.scan(prefix='user:123:', limit=100)
+
+        Returns:
+            list - (key, value) tuples.
+        """
+
+        if after is not None and after >= prefix:
+            keys = self._sorted_keys().iterate(after, include_start=False)
+        else:
+            keys = self._sorted_keys().iterate(prefix)
+
+        keys = takewhile(lambda key: key.startswith(prefix), keys)
+        return [(key, self.fetch(key)) for key in islice(keys, limit)]
+
+    def range(self, start: str = None, end: str = None, limit: int = None, after: str = None) -> list:
+        """
+        Info:
+            Fetches every key from start up to but not including end and its value, in key order.
+            Pass the last key of a page as after to get the next page.
+
+        Paramaters:
+            [Optional]start: str -> None - The first key, None starts at the smallest one.
+            [Optional]end: str -> None - The key to stop before, None goes to the end.
+            [Optional]limit: int -> None - Most items to return, None returns all of them.
+            [Optional]after: str -> None - Only returns keys after this one.
+
+        Usage:
+            my_database.range('a', 'b', limit=100)
+
+        Returns:
+            list - (key, value) tuples.
+        """
+
+        if after is not None and (start is None or after >= start):
+            keys = self._sorted_keys().iterate(after, end, include_start=False)
+        else:
+            keys = self._sorted_keys().iterate(start, end)
+
+        return [(key, self.fetch(key)) for key in islice(keys, limit)]
+
+    def reset(self) -> None:
+        """
+        Info:
+            Resets the database
+
+        Usage:
+            my_database.reset()
+
+        Returns:
+            None
+        """
+        
+        with self._locked():
+            if self.indexed:
+                if not isinstance(self.database, _IndexedStore):
+                    self.load()
+                self.database.clear()
+                self._keys = None
+                return
+
+            self.database = {}
+            self._keys = None
+            self.update()
+    
+    def update(self) -> None:
+        """
+        Info:
+            Updates the database, the file is written to a temporary file first and then swapped in so a crash can not leave it half written.
+            In journal mode this also empties the journal, in indexed mode it rewrites the file with only the latest values.
+
+        Usage:
+            my_database.update()
+
+        Returns:
+            None
+        """
+        
+        with self._locked():
+            if self.indexed:
+                self.database.compact()
+                return
+
+            temporary_name = f'{self.file_name}.tmp'
+            with open(temporary_name, 'w') as my_file:
+                dump(self.database, my_file)
+                if self.sync:
+                    my_file.flush()
+                    fsync(my_file.fileno())
+            replace(temporary_name, self.file_name)
+            self._source = self._source_state()
+            if not self._undo:
+                self._pending = []
+
+            if self.journal:
+                self._open_journal().truncate(0)
+                self._journal_size = 0
+
+    def compact(self) -> None:
+        """
+        Info:
+            Folds the journal into the database file, same as update.
+
+        Usage:
+            my_database.compact()
+
+        Returns:
+            None
+        """
+
+        self.update()
+
+    def snapshot(self) -> None:
+        """
+        Info:
+            Writes the database to a binary snapshot next to the database file, load uses it while the database file is unchanged.
+            The snapshot has a header with a version and the state of the database file and journal, marshaled blocks of keys and values each prefixed with their length, and a crc32 of everything before it.
+            Changes other processes wrote are read in first, and values go through json so a snapshot load returns exactly what loading the json file would, lists for tuples and str dict keys.
+            In indexed mode this saves the key index instead.
+
+        Usage:
+            my_database.snapshot()
+
+        Returns:
+            None
+        """
+
+        with self._locked():
+            self.flush()
+            if self.indexed:
+                self.database.save_index()
+                return
+
+            self._catch_up()
+            source = stat(self.file_name)
+            journal_size = self._journal_size if self.journal else 0
+            temporary_name = f'{self.snapshot_name}.tmp'
+            with open(temporary_name, 'wb') as snapshot_file:
+                header = _SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, _SNAPSHOT_VERSION, source.st_size, source.st_mtime_ns, source.st_ino, journal_size)
+                snapshot_file.write(header)
+                checksum = crc32(header)
+
+                items = iter(self.database.items())
+                while True:
+                    block = dict(islice(items, _SNAPSHOT_BLOCK_SIZE))
+                    if not block:
+                        break
+                    data = marshal_dumps(loads(dumps(block)))
+                    data = _SNAPSHOT_LENGTH.pack(len(data)) + data
+                    snapshot_file.write(data)
+                    checksum = crc32(data, checksum)
+
+                snapshot_file.write(_SNAPSHOT_LENGTH.pack(checksum))
+                if self.sync:
+                    snapshot_file.flush()
+                    fsync(snapshot_file.fileno())
+            replace(temporary_name, self.snapshot_name)
+
+    @contextmanager
+    def batch(self):
+        """
+        Info:
+            Buffers every add and remove made inside the with block and writes them once when it ends.
+            If the block or the write raises, its changes are undone and nothing is written. Batches can be nested, an inner batch that fails only undoes its own changes.
+
+        Usage:
+            with my_database.batch():
+                my_database.add(key, value)
+
+        Returns:
+            Database
+        """
+
+        with self._lock:
+            undo = {}
+            start = len(self._pending)
+            self._undo.append(undo)
+            try:
+                yield self
+            except BaseException:
+                self._undo.pop()
+                self._rollback(undo, start)
+                raise
+
+            self._undo.pop()
+            if self._undo:
+                for key, value in undo.items():
+                    self._undo[-1].setdefault(key, value)
+                return
+
+            try:
+                if self.flush_every or self.flush_interval:
+                    self._schedule_flush()
+                else:
+                    self.flush()
+            except BaseException:
+                self._rollback(undo, start)
+                raise
+
+    transaction = batch
+
+    def flush(self) -> None:
+        """
+        Info:
+            Writes any changes buffered by flush_every or flush_interval, does nothing inside a batch.
+            If the write fails the changes stay buffered and are tried again by the next flush or close, an error from a flush_interval timer is raised from there if that try fails too.
+
+        Usage:
+            my_database.flush()
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            if self._undo:
+                return
+
+            if self._flush_timer:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            error, self._flush_error = self._flush_error, None
+            if self._pending:
+                records, self._pending = self._pending, []
+                try:
+                    self._persist(records)
+                except Exception as new_error:
+                    self._pending[:0] = records
+                    self._flush_error = new_error
+                    if error is not None:
+                        raise new_error from error
+                    raise
+
+    def refresh(self) -> None:
+        """
+        Info:
+            Reads in changes other processes wrote since this database last read or wrote its files, changes waiting to be written here are kept on top.
+
+        Usage:
+            my_database.refresh()
+
+        Returns:
+            None
+        """
+
+        with self._locked():
+            self._catch_up()
+
+    def load(self) -> None:
+        """
+        Info:
+            Loads the database from its snapshot if it is up to date or from the JSON file otherwise, then replays the journal on top of it in journal mode.
+            In indexed mode only the key index is loaded.
+
+        Usage:
+            my_database.load()
+
+        Returns:
+            None
+        """
+        
+        with self._locked():
+            if self.indexed:
+                if isinstance(self.database, _IndexedStore):
+                    self.database.close()
+                self.database = _IndexedStore(self.file_name, self.cache_size, self.sync, self._lock)
+                self._keys = None
+                return
+
+            with _gc_paused():
+                self._source = self._source_state()
+                journal_start = self._load_snapshot()
+                if journal_start is None:
+                    journal_start = 0
+                    with open(self.file_name, 'r') as my_file:
+                        self.database = json_load(my_file)
+                self._keys = None
+
+                if self.journal:
+                    self._replay(journal_start)
+
+    def close(self) -> None:
+        """
+        Info:
+            Writes any buffered changes and closes the journal file if it is open.
+            The files are closed even if the write fails, the error is raised after.
+
+        Usage:
+            my_database.close()
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            try:
+                self.flush()
+            finally:
+                self._close_files()
+
+    def _close_files(self) -> None:
+        with self._lock:
+            with self._locked():
+                if isinstance(self.database, _IndexedStore):
+                    self.database.close()
+            if self._journal_file:
+                self._journal_file.close()
+                self._journal_file = None
+            if self._lock_file:
+                self._lock_file.close()
+                self._lock_file = None
+
+    @contextmanager
+    def _locked(self):
+        """
+        Info:
+            Holds the thread lock and, on the outermost call, an exclusive advisory lock on the .lock file so other processes wait.
+
+        Usage:
+            with self._locked():
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self._lock_depth += 1
+            try:
+                if self._lock_depth == 1 and flock:
+                    if self._lock_file is None:
+                        self._lock_file = open(self.lock_name, 'a')
+                    flock(self._lock_file.fileno(), LOCK_EX)
+                yield
+            finally:
+                self._lock_depth -= 1
+                if not self._lock_depth and flock and self._lock_file:
+                    flock(self._lock_file.fileno(), LOCK_UN)
+
+    def _source_state(self) -> tuple:
+        source = stat(self.file_name)
+        return source.st_size, source.st_mtime_ns, source.st_ino
+
+    def _catch_up(self, records: list = ()) -> None:
+        """
+        Info:
+            Reads in what other processes wrote, then applies the changes waiting to be written here on top of it again.
+
+        Paramaters:
+            [Optional]records: list -> () - Changes about to be written that are no longer pending.
+
+        Usage:
+            self._catch_up(records)
+
+        Returns:
+            None
+        """
+
+        if self.indexed:
+            if self.database.refresh():
+                self._keys = None
+            return
+
+        if self._source != self._source_state():
+            self.load()
+        elif self.journal and getsize(self.journal_name) != self._journal_size:
+            self._replay(self._journal_size)
+        else:
+            return
+
+        self._apply(self._pending)
+        self._apply(records)
+
+    def _apply(self, records: list) -> None:
+        for record in records:
+            if record[0] == 'add':
+                self._set(record[1], record[2])
+            else:
+                self._discard(record[1])
+
+    def _set(self, key: str, value) -> None:
+        if self._keys is not None and key not in self.database:
+            self._keys.add(key)
+        self.database[key] = value
+
+    def _discard(self, key: str) -> None:
+        if key in self.database:
+            del self.database[key]
+            if self._keys is not None:
+                self._keys.discard(key)
+
+    def _sorted_keys(self) -> _SortedKeys:
+        keys = self._keys
+        if keys is None:
+            with self._lock:
+                keys = self._keys = _SortedKeys(self.database)
+        return keys
+
+    def _open_journal(self):
+        if self._journal_file is None:
+            self._journal_file = open(self.journal_name, 'ab')
+        return self._journal_file
+
+    def _rollback(self, undo: dict, start: int) -> None:
+        for key, value in undo.items():
+            if value is _MISSING:
+                self._discard(key)
+            else:
+                self._set(key, value)
+        del self._pending[start:]
+
+    def _remember(self, key: str) -> None:
+        if self._undo and key not in self._undo[-1]:
+            self._undo[-1][key] = self.database.get(key, _MISSING)
+
+    def _commit(self, *records: list) -> None:
+        """
+        Info:
+            Persists the given changes right away, or buffers them while a batch is open or a flush policy is set.
+
+        Paramaters:
+            records: list - The changes, as ['add', key, value] or ['remove', key].
+
+        Usage:
+            self._commit(['add', key, value])
+
+        Returns:
+            None
+        """
+
+        if self._undo:
+            self._pending.extend(records)
+        elif self.flush_every or self.flush_interval:
+            self._pending.extend(records)
+            self._schedule_flush()
+        else:
+            self._persist(records)
+
+    def _schedule_flush(self) -> None:
+        if self.flush_every and len(self._pending) >= self.flush_every:
+            self.flush()
+        elif self.flush_interval and self._pending and self._flush_timer is None:
+            self._flush_timer = Timer(self.flush_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _persist(self, records: list) -> None:
+        """
+        Info:
+            Writes the changes, by appending them to the data file in indexed mode, to the journal in journal mode or by rewriting the database file otherwise.
+
+        Paramaters:
+            records: list - The changes, as ['add', key, value] or ['remove', key].
+
+        Usage:
+            self._persist(records)
+
+        Returns:
+            None
+        """
+
+        with self._locked():
+            self._catch_up(records)
+
+            if self.indexed:
+                self.database.write(records)
+                if self.database.should_compact(self.compact_size):
+                    self.database.compact()
+                return
+
+            if not self.journal:
+                self.update()
+                return
+
+            data = ''.join(f'{dumps(record, separators=(",", ":"))}\n' for record in records).encode()
+            journal_file = self._open_journal()
+            journal_file.write(data)
+            journal_file.flush()
+            if self.sync:
+                fsync(journal_file.fileno())
+
+            self._journal_size += len(data)
+            if self._journal_size > self.compact_size and self._journal_size > getsize(self.file_name):
+                self.compact()
+
+    def _load_snapshot(self) -> Union[int, None]:
+        """
+        Info:
+            Loads the snapshot if it exists, is intact and was taken from the current database file.
+
+        Usage:
+            self._load_snapshot()
+
+        Returns:
+            Union[int, None] - The journal size when the snapshot was taken, or None if it could not be used.
+        """
+
+        try:
+            with open(self.snapshot_name, 'rb') as snapshot_file:
+                data = snapshot_file.read()
+            source = stat(self.file_name)
+        except FileNotFoundError:
+            return None
+
+        if len(data) < _SNAPSHOT_HEADER.size + _SNAPSHOT_LENGTH.size:
+            return None
+        magic, version, size, mtime, inode, journal_size = _SNAPSHOT_HEADER.unpack_from(data)
+        if (magic, version, size, mtime, inode) != (_SNAPSHOT_MAGIC, _SNAPSHOT_VERSION, source.st_size, source.st_mtime_ns, source.st_ino):
+            return None
+        if journal_size and (not self.journal or getsize(self.journal_name) < journal_size):
+            return None
+        end = len(data) - _SNAPSHOT_LENGTH.size
+        if crc32(memoryview(data)[:end]) != _SNAPSHOT_LENGTH.unpack_from(data, end)[0]:
+            return None
+
+        database = {}
+        view = memoryview(data)
+        offset = _SNAPSHOT_HEADER.size
+        while offset < end:
+            length, = _SNAPSHOT_LENGTH.unpack_from(data, offset)
+            offset += _SNAPSHOT_LENGTH.size
+            database.update(marshal_loads(view[offset:offset + length]))
+            offset += length
+
+        self.database = database
+        return journal_size
+
+    def _replay(self, start: int = 0) -> None:
+        """
+        Info:
+            Applies the journal to the loaded database, a torn record left by a crash is cut off.
+
+        Paramaters:
+            [Optional]start: int -> 0 - Byte offset to start replaying from.
+
+        Usage:
+            self._replay()
+
+        Returns:
+            None
+        """
+
+        valid_size = start
+        try:
+            with open(self.journal_name, 'rb') as journal_file:
+                journal_file.seek(start)
+                for line in journal_file:
+                    try:
+                        record = loads(line)
+                    except ValueError:
+                        break
+                    if not line.endswith(b'\n'):
+                        break
+
+                    self._apply([record])
+                    valid_size += len(line)
+        except FileNotFoundError:
+            pass
+
+        self._open_journal().truncate(valid_size)
+        self._journal_size = valid_size
+
+class AsyncDatabase:
+    """
+    Info:
+        Wraps a Database for asyncio code, the files are written on a background thread so the event loop never waits on them.
+        Writes made while a flush is running are coalesced into the next flush, each write returns once the flush holding it is on disk.
+        It takes the same paramaters as Database and stores its data the same way, the wrapped Database is kept in database.
+
+    Options:
+        open - Creates the database without blocking the event loop
+        aadd - Adds a key and value
+        aremove - Removes a key and value
+        aget - Fetches a key and value
+        aflush - Waits for every write to be on disk
+        aclose - Writes everything and closes the database
+
+    Usage:
+        my_database = await AsyncDatabase.open(journal=True)
+        await my_database.aadd(key, value)
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """
+        Info:
+            Creates the wrapped Database, which loads its files right away, use open from inside a running event loop.
+
+        Paramaters:
+            args, kwargs - Passed to Database.
+
+        Usage:
+            my_database = AsyncDatabase(journal=True)
+
+        Returns:
+            None
+        """
+        self.database = Database(*args, **kwargs)
+        self._overlay = {}
+        self._pending = []
+        self._flushing = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    @classmethod
+    async def open(cls, *args, **kwargs) -> 'AsyncDatabase':
+        """
+        Info:
+            Creates the database on a worker thread.
+
+        Paramaters:
+            args, kwargs - Passed to Database.
+
+        Usage:
+            my_database = await AsyncDatabase.open(journal=True)
+
+        Returns:
+            AsyncDatabase
+        """
+        from asyncio import get_running_loop
+
+        return await get_running_loop().run_in_executor(None, partial(cls, *args, **kwargs))
+
+    async def aadd(self, key: str, value: Union[str, int, list, dict, tuple]) -> None:
+        """
+        Info:
+            Adds a key and value to the database, aget sees it right away.
+
+        Paramaters:
+            key: str- the key of the item
+            value: Union[str, int, list, dict, tuple] - The value of the key
+
+        Usage:
+            await my_database.aadd(key, value)
+
+        Returns:
+            None
+        """
+        self._overlay[key] = value
+        await self._write(['add', key, value])
+
+    async def aremove(self, key: str) -> None:
+        """
+        Info:
+            Removes a key and value from the database
+
+        Paramaters:
+            key: str- the key of the item
+
+        Usage:
+            await my_database.aremove(key)
+
+        Returns:
+            None
+        """
+        if key in self._overlay:
+            missing = self._overlay[key] is _MISSING
+        else:
+            missing = key not in self.database.database
+        if missing:
+            raise KeyError(key)
+
+        self._overlay[key] = _MISSING
+        await self._write(['remove', key])
+
+    async def aget(self, key: str) -> Union[str, int, list, dict, tuple, None]:
+        """
+        Info:
+            Fetches the keys item and returns it, including writes that are not on disk yet.
+
+        Paramaters:
+            key: str - The key to fetch and return
+
+        Usage:
+            await my_database.aget(key)
+
+        Returns:
+            Union[str, int, list, dict, tuple]
+        """
+        if key in self._overlay:
+            value = self._overlay[key]
+            return None if value is _MISSING else value
+
+        return self.database.fetch(key)
+
+    async def aflush(self) -> None:
+        """
+        Info:
+            Waits until every write made so far is on disk.
+
+        Usage:
+            await my_database.aflush()
+
+        Returns:
+            None
+        """
+        while self._flushing is not None and not self._flushing.done():
+            await self._flushing
+
+    async def aclose(self) -> None:
+        """
+        Info:
+            Writes everything and closes the database.
+
+        Usage:
+            await my_database.aclose()
+
+        Returns:
+            None
+        """
+        from asyncio import get_running_loop
+
+        await self.aflush()
+        await get_running_loop().run_in_executor(self._executor, self.database.close)
+        self._executor.shutdown()
+
+    async def _write(self, record: list) -> None:
+        from asyncio import get_running_loop
+
+        loop = get_running_loop()
+        future = loop.create_future()
+        self._pending.append((record, future))
+        if self._flushing is None or self._flushing.done():
+            self._flushing = loop.create_task(self._flush())
+        await future
+
+    async def _flush(self) -> None:
+        """
+        Info:
+            Writes the pending records in one batch on the worker thread, again and again until none are left.
+            If a batch fails its writes are undone in memory and each of their callers gets the error.
+
+        Usage:
+            self._flush()
+
+        Returns:
+            None
+        """
+        from asyncio import get_running_loop
+
+        loop = get_running_loop()
+        while self._pending:
+            pending, self._pending = self._pending, []
+            records = [record for record, _ in pending]
+            try:
+                await loop.run_in_executor(self._executor, self._persist, records)
+            except Exception as error:
+                outcome = error
+            else:
+                outcome = None
+
+            for record in records:
+                current = self._overlay.get(record[1])
+                if current is (record[2] if record[0] == 'add' else _MISSING):
+                    del self._overlay[record[1]]
+
+            for _, future in pending:
+                if future.done():
+                    continue
+                if outcome is None:
+                    future.set_result(None)
+                else:
+                    future.set_exception(outcome)
+
+    def _persist(self, records: list) -> None:
+        with self.database.batch():
+            for record in records:
+                if record[0] == 'add':
+                    self.database.add(record[1], record[2])
+                elif record[1] in self.database.database:
+                    self.database.remove(record[1])
+        self.database.flush()
+
+def hash_item(item: Union[str, bytes, bytearray, memoryview], algorithm: str = 'sha256') -> str:
+    """
+    Info:
+        Hashes the given string or bytes like object and returns the hex digest.
+        Bytes, bytearrays and memoryviews are hashed in place without being copied.
+
+    Paramaters:
+        item: Union[str, bytes, bytearray, memoryview] - The item to hash
+        [Optional]algorithm: str -> sha256 - Any algorithm hashlib knows, like sha1, blake2b or md5.
+    
+    Usage:
+        hash_item(item)
+        hash_item(data, 'blake2b')
+
+    Returns:
+        str
+    """
+    if isinstance(item, str):
+        item = item.encode()
+    if algorithm == 'sha256':
+        return sha256(item).hexdigest()
+    return new_hash(algorithm, item).hexdigest()
+
+def hash_file(file_name: str, algorithm: str = 'sha256', chunk_size: int = 1 << 20, use_mmap: bool = False) -> str:
+    """
+    Info:
+        Hashes a file of any size and returns the hex digest.
+        The file is read in chunks into one reused buffer, or with use_mmap hashed straight from a memory map, so it is never held in memory whole.
+
+    Paramaters:
+        file_name: str - The file to hash.
+        [Optional]algorithm: str -> sha256 - Any algorithm hashlib knows.
+        [Optional]chunk_size: int -> 1048576 - Bytes read at once.
+        [Optional]use_mmap: bool -> False - Hashes a memory map of the file instead of reading it.
+
+    Usage:
+        hash_file(file)
+
+    Returns:
+        str
+    """
+    digest = new_hash(algorithm)
+    with open(file_name, 'rb', buffering=0) as file:
+        if use_mmap:
+            if fstat(file.fileno()).st_size:
+                with mmap(file.fileno(), 0, access=ACCESS_READ) as mapped:
+                    digest.update(mapped)
+            return digest.hexdigest()
+
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        while True:
+            read = file.readinto(buffer)
+            if not read:
+                return digest.hexdigest()
+            digest.update(view[:read])
+
+def hash_many(paths: list, algorithm: str = 'sha256', workers: int = None, chunk_size: int = 1 << 20, use_mmap: bool = False) -> dict:
+    """
+    Info:
+        Hashes many files at once on a thread pool, hashlib lets go of the GIL while hashing so the files are hashed in parallel.
+
+    Paramaters:
+        paths: list - The files to hash.
+        [Optional]algorithm: str -> sha256 - Any algorithm hashlib knows.
+        [Optional]workers: int -> None - Amount of threads, None lets ThreadPoolExecutor choose.
+        [Optional]chunk_size: int -> 1048576 - Bytes read at once per file.
+        [Optional]use_mmap: bool -> False - Hashes memory maps of the files instead of reading them.
+
+    Usage:
+        hash_many(paths)
+
+    Returns:
+        dict - path to hex digest, in the order of paths.
+    """
+    paths = [*paths]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        digests = pool.map(partial(hash_file, algorithm=algorithm, chunk_size=chunk_size, use_mmap=use_mmap), paths)
+        return dict(zip(paths, digests))
+
+
+def hash_directory(directory: str, index_file: str = None, algorithm: str = 'sha256', workers: int = None, use_mmap: bool = False) -> dict:
+    """
+    Info:
+        Fingerprints a directory tree and returns its Merkle root along with the paths that changed since the last run.
+        Per file digests are kept in an index keyed by path, size and mtime, only new files and files whose size or mtime changed are hashed again, on a thread pool.
+        Every directory's digest covers the names, kinds and digests of its entries so the root changes when any file, link or directory does.
+
+    Paramaters:
+        directory: str - The directory to fingerprint.
+        [Optional]index_file: str -> None - Where to keep the index, None keeps it as .hash_index.json inside the directory, it is never part of the hash.
+        [Optional]algorithm: str -> sha256 - Any algorithm hashlib knows, changing it hashes everything again.
+        [Optional]workers: int -> None - Amount of threads hashing files, None lets ThreadPoolExecutor choose.
+        [Optional]use_mmap: bool -> False - Hashes memory maps of the files instead of reading them.
+
+    Usage:
+        result = hash_directory('build')
+        result['root'], result['changed']
+
+    Returns:
+        dict - root, files (path to digest), added, changed and removed paths and the amount of files hashed, a file whose mtime changed but whose content did not is hashed but not listed as changed.
+    """
+    from os.path import join, abspath
+
+    index_file = abspath(index_file or join(directory, '.hash_index.json'))
+    skipped = (index_file, f'{index_file}.tmp')
+
+    found = {}
+    links = {}
+    folders = ['']
+    stack = ['']
+    while stack:
+        folder = stack.pop()
+        with scandir(join(directory, folder)) as entries:
+            for entry in entries:
+                path = f'{folder}/{entry.name}' if folder else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    folders.append(path)
+                    stack.append(path)
+                elif entry.is_symlink():
+                    links[path] = hash_item(readlink(entry.path), algorithm)
+                elif entry.is_file(follow_symlinks=False) and abspath(entry.path) not in skipped:
+                    info = entry.stat(follow_symlinks=False)
+                    found[path] = [info.st_size, info.st_mtime_ns]
+
+    try:
+        with open(index_file, 'r') as index:
+            saved = json_load(index)
+        old = saved['files'] if saved.get('algorithm') == algorithm else {}
+    except (OSError, ValueError, KeyError, AttributeError):
+        old = {}
+
+    added = sorted(path for path in found if path not in old)
+    touched = [path for path in found if path in old and old[path][:2] != found[path]]
+    removed = sorted(path for path in old if path not in found)
+
+    stale = {*added, *touched}
+    digests = hash_many([join(directory, path) for path in stale], algorithm, workers, use_mmap=use_mmap)
+    files = {}
+    for path, info in found.items():
+        files[path] = [*info, digests[join(directory, path)]] if path in stale else old[path]
+    changed = sorted(path for path in touched if files[path][2] != old[path][2])
+
+    if stale or removed or len(old) != len(files):
+        temp_name = f'{index_file}.tmp'
+        with open(temp_name, 'w') as index:
+            dump({'algorithm': algorithm, 'files': files}, index, separators=(',', ':'))
+        replace(temp_name, index_file)
+
+    children = {folder: [] for folder in folders}
+    for kind, entries in (('f', files), ('l', links)):
+        for path, value in entries.items():
+            folder, _, name = path.rpartition('/')
+            children[folder].append((name, kind, value[2] if kind == 'f' else value))
+
+    tree = {}
+    for folder in sorted(folders, key=lambda folder: folder.count('/') + bool(folder), reverse=True):
+        digest = new_hash(algorithm)
+        for name, kind, value in sorted(children[folder]):
+            digest.update(f'{kind}{name}\0{value}\0'.encode())
+        tree[folder] = digest.hexdigest()
+        if folder:
+            parent, _, name = folder.rpartition('/')
+            children[parent].append((name, 'd', tree[folder]))
+
+    return {
+        'root': tree[''],
+        'files': {path: info[2] for path, info in files.items()},
+        'added': added,
+        'changed': changed,
+        'removed': removed,
+        'hashed': len(stale)
+    }
+
+_js_contexts = {}
+_js_contexts_lock = RLock()
+
+_js2py_tag = None
+
+def _js2py_version() -> str:
+    """
+    Info:
+        Returns the installed js2py version, or a hash of its translator when it was not installed as a distribution, so cached translations are dropped when js2py changes.
+
+    Usage:
+        _js2py_version()
+
+    Returns:
+        str
+    """
+    global _js2py_tag
+    if _js2py_tag is None:
+        from importlib.metadata import version, PackageNotFoundError
+
+        try:
+            _js2py_tag = version('js2py')
+        except PackageNotFoundError:
+            from js2py import translate_js
+
+            with open(modules[translate_js.__module__].__file__, 'rb') as translator:
+                _js2py_tag = sha256(translator.read()).hexdigest()
+    return _js2py_tag
+
+def _compile_js(source: str, file: str, cache_dir: str = None):
+    """
+    Info:
+        Translates javascript source to python and compiles it.
+        With a cache_dir the compiled code is stored there keyed by the sha256 of the source and the js2py version and by the python bytecode version, so new processes skip translation entirely.
+
+    Paramaters:
+        source: str - The javascript source.
+        file: str - File name the code is compiled under.
+        [Optional]cache_dir: str -> None - Directory for the compiled code, None does not store it.
+
+    Usage:
+        _compile_js(source, file, cache_dir)
+
+    Returns:
+        code
+    """
+    if cache_dir is not None:
+        from importlib.util import MAGIC_NUMBER
+
+        key = sha256(f'{_js2py_version()}\0{source}'.encode()).hexdigest()
+        cache_name = f'{cache_dir}/{key}.{MAGIC_NUMBER.hex()}.jsc'
+        try:
+            with open(cache_name, 'rb') as cache_file:
+                return marshal_loads(cache_file.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+
+    from js2py import translate_js
+
+    code = compile(translate_js(source, HEADER=''), file, 'exec')
+    if cache_dir is not None:
+        makedirs(cache_dir, exist_ok=True)
+        temp_name = f'{cache_name}.{getpid()}.tmp'
+        try:
+            with open(temp_name, 'wb') as cache_file:
+                cache_file.write(marshal_dumps(code))
+            replace(temp_name, cache_name)
+        except OSError:
+            try:
+                unlink(temp_name)
+            except OSError:
+                pass
+    return code
+
+def _js_context(file: str, cache_dir: str = None):
+    """
+    Info:
+        Returns an evaluated js2py context of a js file, translating and running the file only the first time and again once its content changes.
+        The file's mtime and size are checked first and the content hash only when they changed, so touching a file does not re-run it.
+
+    Paramaters:
+        file: str - The js file to load.
+        [Optional]cache_dir: str -> None - Directory to keep the translated code in across processes.
+
+    Usage:
+        _js_context(file)
+
+    Returns:
+        js2py.EvalJs
+    """
+    from os.path import abspath
+
+    path = abspath(file)
+    info = stat(path)
+    version = (info.st_mtime_ns, info.st_size)
+    cached = _js_contexts.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[2]
+
+    with _js_contexts_lock:
+        cached = _js_contexts.get(path)
+        if cached is not None and cached[0] == version:
+            return cached[2]
+
+        with open(path, 'r', encoding='utf-8') as js_file:
+            version = (fstat(js_file.fileno()).st_mtime_ns, fstat(js_file.fileno()).st_size)
+            source = js_file.read()
+        digest = sha256(source.encode()).digest()
+        if cached is not None and cached[1] == digest:
+            cached[0] = version
+            return cached[2]
+
+        from js2py import EvalJs
+
+        context = EvalJs()
+        exec(_compile_js(source, file, cache_dir), context._context)
+        _js_contexts[path] = [version, digest, context]
+        return context
+
+def clear_js_cache(file: str = None) -> None:
+    """
+    Info:
+        Drops the cached context of a js file so call_js_function runs it again, the on disk cache is left alone.
+
+    Paramaters:
+        [Optional]file: str -> None - The js file to drop, None drops every file.
+
+    Usage:
+        clear_js_cache(file)
+
+    Returns:
+        None
+    """
+    from os.path import abspath
+
+    with _js_contexts_lock:
+        if file is None:
+            _js_contexts.clear()
+        else:
+            _js_contexts.pop(abspath(file), None)
+
+def call_js_function(file: str, function: str, args: tuple = (), cache: bool = True, cache_dir: str = None) -> Union[str, int, float, dict, list, tuple, Callable]:
+    """
+    Info:
+        Calls a javascript function in a js file.
+        The file is translated and run once and its context is reused by later calls until the file changes.
+        Global state the file keeps is shared between cached calls, pass cache=False to run the file fresh.
+    
+    Paramaters:
+        file: str - The js file to use.
+        function: str - The function to call.
+        args: tuple - Arguments to pass to the function.
+        [Optional]cache: bool -> True - Reuses the evaluated file between calls.
+        [Optional]cache_dir: str -> None - Directory to keep the translated python in so new processes skip translation.
+
+    Usage:
+        call_js_function(file, function, args=(arg1,))
+  
+    Returns:
+       Union[str, int, float, dict, list, tuple, Callable]
+    """
+    if cache:
+        return _js_context(file, cache_dir)[function](*args)
+
+    from js2py import run_file
+
+    eval_result, js_function = run_file(file)
+    result = js_function[function](*args)
+    
+    return result
+
+def _js_plain(result):
+    """
+    Info:
+        Turns a js object or array returned by js2py into a dict or list, other results are returned as they are.
+
+    Paramaters:
+        result - A value returned by a js2py function.
+
+    Usage:
+        _js_plain(result)
+
+    Returns:
+        Union[str, int, float, dict, list, tuple, Callable]
+    """
+    from js2py.base import JsObjectWrapper
+
+    if isinstance(result, JsObjectWrapper):
+        if result._obj.Class == 'Object':
+            return result.to_dict()
+        if result._obj.Class.endswith('Array'):
+            return result.to_list()
+    return result
+
+def _js_call_chunk(file: str, cache_dir: str, function: str, chunk: list) -> list:
+    """
+    Info:
+        Runs a chunk of calls inside a worker process, js objects and arrays in the results are turned into dicts and lists so they can be sent back.
+
+    Paramaters:
+        file: str - The js file to use.
+        cache_dir: str - Directory of the translated python, or None.
+        function: str - The function to call.
+        chunk: list - Tuples of arguments, one per call.
+
+    Usage:
+        _js_call_chunk(file, cache_dir, function, chunk)
+
+    Returns:
+        list
+    """
+    js_function = _js_context(file, cache_dir)[function]
+    return [_js_plain(js_function(*args)) for args in chunk]
+
+class JsModule:
+    """
+    Info:
+        Handle on a js file that keeps its evaluated context alive so functions can be called many times without running the file again.
+        With processes every worker process evaluates the file once and call_many spreads the calls across them.
+        js objects and arrays are returned as dicts and lists with or without processes, other results like functions stay js2py objects.
+
+    Options:
+        call - Calls a function with arguments
+        call_many - Calls a function once for every set of arguments
+        reload - Runs the file again if it changed
+        close - Shuts down the worker processes
+
+    Usage:
+        with JsModule(file, processes=4) as module:
+            module.call_many('function', [(1, 2), (3, 4)])
+    """
+
+    def __init__(self, file: str, processes: int = None, cache_dir: str = None, chunk_size: int = 256) -> None:
+        """
+        Info:
+            Evaluates the file and starts the worker processes if asked to.
+
+        Paramaters:
+            file: str - The js file to use.
+            [Optional]processes: int -> None - Amount of worker processes for call_many, None or 0 calls everything in this process.
+            [Optional]cache_dir: str -> None - Directory to keep the translated python in so workers skip translation.
+            [Optional]chunk_size: int -> 256 - Amount of calls sent to a worker at once.
+
+        Usage:
+            module = JsModule(file)
+
+        Returns:
+            None
+        """
+        self.file = file
+        self.cache_dir = cache_dir
+        self.chunk_size = chunk_size
+        self.context = _js_context(file, cache_dir)
+        self._functions = {}
+        self._pool = None
+
+        if processes:
+            from concurrent.futures import ProcessPoolExecutor
+            self._pool = ProcessPoolExecutor(max_workers=processes, initializer=_js_context, initargs=(file, cache_dir))
+
+    def __enter__(self) -> 'JsModule':
+        return self
+
+    def __exit__(self, *error) -> None:
+        self.close()
+
+    def _function(self, function: str) -> Callable:
+        js_function = self._functions.get(function)
+        if js_function is None:
+            js_function = self._functions[function] = self.context[function]
+        return js_function
+
+    def call(self, function: str, *args) -> Union[str, int, float, dict, list, tuple, Callable]:
+        """
+        Info:
+            Calls a javascript function of the module in this process, js objects and arrays come back as dicts and lists.
+
+        Paramaters:
+            function: str - The function to call.
+            args - Arguments to pass to the function.
+
+        Usage:
+            module.call('function', arg1, arg2)
+
+        Returns:
+            Union[str, int, float, dict, list, tuple, Callable]
+        """
+        return _js_plain(self._function(function)(*args))
+
+    def call_many(self, function: str, list_of_args) -> list:
+        """
+        Info:
+            Calls a javascript function once for every tuple of arguments and returns the results in order.
+            The function is looked up once and js objects and arrays come back as dicts and lists, with worker processes the calls are sent in chunks and other results must be picklable.
+
+        Paramaters:
+            function: str - The function to call.
+            list_of_args: Iterable - Tuples of arguments, one per call.
+
+        Usage:
+            module.call_many('function', [(1, 2), (3, 4)])
+
+        Returns:
+            list
+        """
+        if self._pool is None:
+            js_function = self._function(function)
+            return [_js_plain(js_function(*args)) for args in list_of_args]
+
+        items = iter(list_of_args)
+        chunks = iter(lambda: [*islice(items, self.chunk_size)], [])
+        results = []
+        for chunk in self._pool.map(partial(_js_call_chunk, self.file, self.cache_dir, function), chunks):
+            results += chunk
+        return results
+
+    def reload(self) -> None:
+        """
+        Info:
+            Runs the file again if its content changed since it was evaluated, worker processes pick the change up on their next chunk.
+
+        Usage:
+            module.reload()
+
+        Returns:
+            None
+        """
+        context = _js_context(self.file, self.cache_dir)
+        if context is not self.context:
+            self.context = context
+            self._functions.clear()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
 
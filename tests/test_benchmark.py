@@ -0,0 +1,35 @@
+import json
+
+from depression import average_time, benchmark
+
+
+def test_average_time_calls_the_function_amount_times(capsys):
+    calls = []
+
+    @average_time(amount=3)
+    def record(value):
+        calls.append(value)
+        return value * 2
+
+    assert record(5) == 10
+    assert calls == [5, 5, 5]
+    assert 'record: 3 samples of 1 loops' in capsys.readouterr().out
+
+
+def test_benchmark_report_and_output(tmp_path):
+    output = tmp_path / 'report.json'
+    report = benchmark(sum, args=(range(100),), samples=5, output=str(output))
+
+    assert report['samples'] == 5 and report['loops'] >= 1 and len(report['times_ns']) == 5
+    assert report['min_ns'] <= report['median_ns'] <= report['p95_ns'] <= report['p99_ns'] <= report['max_ns']
+    assert json.loads(output.read_text())['median_ns'] == report['median_ns']
+
+
+def test_baseline_flags_only_significant_slowdowns():
+    fast = {'median_ns': 100.0, 'times_ns': [100.0 + index % 3 for index in range(30)]}
+    slow = {'median_ns': 200.0, 'times_ns': [200.0 + index % 3 for index in range(30)]}
+    from depression import _finish_benchmark
+
+    assert _finish_benchmark(dict(slow), None, fast, 0.01, 0.05)['comparison']['regression']
+    assert not _finish_benchmark(dict(fast), None, slow, 0.01, 0.05)['comparison']['regression']
+    assert not _finish_benchmark(dict(fast), None, dict(fast), 0.01, 0.05)['comparison']['significant']
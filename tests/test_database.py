@@ -0,0 +1,77 @@
+from time import sleep
+
+import pytest
+
+from depression import Database
+
+
+def _failing_once(database):
+    persist = database._persist
+    calls = []
+
+    def fail_first(records):
+        calls.append(records)
+        if len(calls) == 1:
+            raise OSError('disk full')
+        persist(records)
+    database._persist = fail_first
+    return calls
+
+
+@pytest.mark.parametrize('mode', [{}, {'journal': True}, {'indexed': True}])
+def test_failed_flush_keeps_buffered_changes(tmp_path, mode):
+    path = str(tmp_path / 'database.json')
+    database = Database(path=path, flush_every=100, **mode)
+    _failing_once(database)
+    database.add('a', 1)
+    database.add('b', 2)
+
+    with pytest.raises(OSError):
+        database.flush()
+    assert [record[1] for record in database._pending] == ['a', 'b']
+
+    database.flush()
+    database.close()
+    assert Database(create_new_database=False, path=path, **mode).fetch('b') == 2
+
+
+@pytest.mark.filterwarnings('ignore::pytest.PytestUnhandledThreadExceptionWarning')
+def test_timer_flush_error_is_reported_by_the_next_flush(tmp_path):
+    path = str(tmp_path / 'database.json')
+    database = Database(path=path, journal=True, flush_interval=0.01)
+    persist = database._persist
+
+    def always_fail(records):
+        raise OSError('disk full')
+    database._persist = always_fail
+    database.add('a', 1)
+    sleep(0.2)
+    assert database._flush_error is not None
+
+    with pytest.raises(OSError) as error:
+        database.close()
+    assert isinstance(error.value.__cause__, OSError)
+
+    database._persist = persist
+    database.flush()
+    assert Database(create_new_database=False, path=path, journal=True).fetch('a') == 1
+
+
+@pytest.mark.parametrize('mode', [{}, {'journal': True}])
+def test_snapshot_load_matches_json_load(tmp_path, mode):
+    path = str(tmp_path / 'database.json')
+    database = Database(path=path, **mode)
+    database.add('t', (1, 2))
+    database.add('m', {1: 'x', 'nested': ({2: (3,)},)})
+    database.add('s', 'text')
+    database.close()
+    from_json = Database(create_new_database=False, path=path, **mode).database
+
+    snapshotted = Database(create_new_database=False, path=path, **mode)
+    snapshotted.add('t', (1, 2))
+    snapshotted.snapshot()
+    snapshotted.close()
+    from_snapshot = Database(create_new_database=False, path=path, **mode)
+
+    assert from_snapshot._load_snapshot() is not None
+    assert from_snapshot.database == from_json == {'t': [1, 2], 'm': {'1': 'x', 'nested': [{'2': [3]}]}, 's': 'text'}
@@ -0,0 +1,97 @@
+from multiprocessing import Process
+from threading import Thread
+
+import pytest
+
+from depression import Database
+
+MODES = [{}, {'journal': True}, {'indexed': True}]
+WRITERS = 4
+ADDS = 100
+REMOVES = 10
+
+
+def _write(path: str, mode: dict, writer: int) -> None:
+    database = Database(create_new_database=False, path=path, **mode)
+    for number in range(ADDS):
+        database.add(f'{writer}-{number}', number)
+    for number in range(REMOVES):
+        database.remove(f'{writer}-{number}')
+    database.close()
+
+
+def _expected() -> dict:
+    return {f'{writer}-{number}': number for writer in range(WRITERS) for number in range(REMOVES, ADDS)}
+
+
+def _stored(path: str, mode: dict) -> dict:
+    database = Database(create_new_database=False, path=path, **mode)
+    stored = dict(database.scan())
+    database.close()
+    return stored
+
+
+@pytest.mark.parametrize('mode', MODES)
+def test_processes_lose_no_updates(tmp_path, mode):
+    path = str(tmp_path / 'database.json')
+    Database(path=path, **mode).close()
+
+    writers = [Process(target=_write, args=(path, mode, writer)) for writer in range(WRITERS)]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join(60)
+        assert writer.exitcode == 0
+
+    assert _stored(path, mode) == _expected()
+
+
+@pytest.mark.parametrize('mode', MODES)
+def test_threads_lose_no_updates(tmp_path, mode):
+    path = str(tmp_path / 'database.json')
+    database = Database(path=path, **mode)
+    wrong = []
+    done = False
+
+    def write(writer: int) -> None:
+        for number in range(ADDS):
+            database.add(f'{writer}-{number}', number)
+        for number in range(REMOVES):
+            database.remove(f'{writer}-{number}')
+
+    def read() -> None:
+        while not done:
+            for writer in range(WRITERS):
+                for number in range(0, ADDS, 7):
+                    value = database.fetch(f'{writer}-{number}')
+                    if value not in (None, number):
+                        wrong.append((writer, number, value))
+
+    reader = Thread(target=read)
+    reader.start()
+    writers = [Thread(target=write, args=(writer,)) for writer in range(WRITERS)]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+    done = True
+    reader.join()
+    database.close()
+
+    assert not wrong
+    assert _stored(path, mode) == _expected()
+
+
+@pytest.mark.parametrize('mode', MODES)
+def test_snapshot_keeps_writes_from_other_processes(tmp_path, mode):
+    path = str(tmp_path / 'database.json')
+    first = Database(path=path, **mode)
+    first.add('from_first', 0)
+    other = Process(target=_write, args=(path, mode, 0))
+    other.start()
+    other.join(60)
+    assert other.exitcode == 0
+
+    first.snapshot()
+    first.close()
+    assert _stored(path, mode) == {'from_first': 0, **{f'0-{number}': number for number in range(REMOVES, ADDS)}}
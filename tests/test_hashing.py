@@ -0,0 +1,72 @@
+from hashlib import sha256, blake2b
+from os import utime, remove, rename
+
+from depression import hash_item, hash_file, hash_many, hash_directory
+
+
+def test_hash_item_accepts_str_and_buffers():
+    expected = sha256(b'abc').hexdigest()
+    assert hash_item('abc') == hash_item(b'abc') == hash_item(bytearray(b'abc')) == hash_item(memoryview(b'xabc')[1:]) == expected
+    assert hash_item(b'abc', 'blake2b') == blake2b(b'abc').hexdigest()
+
+
+def test_hash_file_and_hash_many(tmp_path):
+    paths = []
+    for index, size in enumerate((0, 1, 4096, 100003)):
+        path = tmp_path / f'file{index}'
+        path.write_bytes(bytes(range(256)) * (size // 256) + b'x' * (size % 256))
+        paths.append(str(path))
+
+    expected = {path: sha256(open(path, 'rb').read()).hexdigest() for path in paths}
+    for path in paths:
+        assert hash_file(path, chunk_size=1000) == hash_file(path, use_mmap=True) == expected[path]
+    assert hash_many(paths, workers=3) == expected
+    assert list(hash_many(paths)) == paths
+
+
+def _tree(tmp_path):
+    root = tmp_path / 'tree'
+    for folder in ('a', 'a/b', 'c'):
+        (root / folder).mkdir(parents=True)
+    for index, path in enumerate(('a/one.txt', 'a/b/two.txt', 'c/three.txt', 'top.txt')):
+        (root / path).write_text(f'content {index}')
+    return root
+
+
+def test_rerun_on_unchanged_tree_hashes_nothing(tmp_path):
+    root = _tree(tmp_path)
+    first = hash_directory(str(root))
+    assert first['hashed'] == 4 and first['added'] == sorted(first['files'])
+
+    second = hash_directory(str(root))
+    assert second['root'] == first['root']
+    assert (second['hashed'], second['added'], second['changed'], second['removed']) == (0, [], [], [])
+
+
+def test_touched_files_are_not_reported_as_changed(tmp_path):
+    root = _tree(tmp_path)
+    first = hash_directory(str(root))
+    utime(root / 'a/one.txt', ns=(1, 1))
+
+    second = hash_directory(str(root))
+    assert second['hashed'] == 1
+    assert second['changed'] == []
+    assert second['root'] == first['root']
+    assert hash_directory(str(root))['hashed'] == 0
+
+
+def test_changes_are_reported_and_move_the_root(tmp_path):
+    root = _tree(tmp_path)
+    first = hash_directory(str(root))
+    (root / 'a/b/two.txt').write_text('edited content')
+    remove(root / 'c/three.txt')
+    (root / 'new.txt').write_text('new')
+
+    second = hash_directory(str(root))
+    assert (second['added'], second['changed'], second['removed']) == (['new.txt'], ['a/b/two.txt'], ['c/three.txt'])
+    assert second['root'] != first['root']
+
+    rename(root / 'new.txt', root / 'renamed.txt')
+    third = hash_directory(str(root))
+    assert (third['added'], third['removed']) == (['renamed.txt'], ['new.txt'])
+    assert third['root'] != second['root']
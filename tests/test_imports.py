@@ -0,0 +1,22 @@
+import subprocess
+import sys
+from os.path import dirname, abspath
+
+ROOT = dirname(dirname(abspath(__file__)))
+HEAVY_MODULES = ('requests', 'yaml', 'js2py', 'statistics', 'multiprocessing', 'concurrent.futures.process', 'numpy')
+
+
+def _fresh_import(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+
+
+def test_bare_import_loads_no_heavy_modules():
+    result = _fresh_import(f'import sys, depression; print(",".join(name for name in {HEAVY_MODULES!r} if name in sys.modules))')
+    assert result.stdout.strip() == ''
+
+
+def test_importtime_does_not_list_heavy_modules():
+    result = _fresh_import('import depression')
+    imported = {line.rsplit('|', 1)[-1].strip() for line in result.stderr.splitlines() if '|' in line}
+    assert 'depression' in imported
+    assert not imported & set(HEAVY_MODULES)
@@ -0,0 +1,54 @@
+from os import listdir
+
+import pytest
+
+import depression
+
+pytest.importorskip('js2py')
+
+SOURCE = '''
+var calls = 0;
+function add(a, b) { calls += 1; return a + b; }
+function point(x) { return {x: x, list: [1, 2, x], nested: {y: [x]}}; }
+function count() { return calls; }
+'''
+
+
+@pytest.fixture
+def js_file(tmp_path):
+    path = tmp_path / 'module.js'
+    path.write_text(SOURCE)
+    yield str(path)
+    depression.clear_js_cache()
+
+
+def test_disk_cache_is_keyed_by_js2py_version(js_file, tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / 'cache')
+    assert depression.call_js_function(js_file, 'add', (1, 2), cache_dir=cache_dir) == 3
+    assert len(listdir(cache_dir)) == 1
+
+    depression.clear_js_cache()
+    assert depression.call_js_function(js_file, 'add', (1, 2), cache_dir=cache_dir) == 3
+    assert len(listdir(cache_dir)) == 1
+
+    monkeypatch.setattr(depression, '_js2py_tag', 'another version')
+    depression.clear_js_cache()
+    assert depression.call_js_function(js_file, 'add', (1, 2), cache_dir=cache_dir) == 3
+    assert len(listdir(cache_dir)) == 2
+
+
+def test_changed_file_is_translated_again(js_file):
+    assert depression.call_js_function(js_file, 'add', (2, 3)) == 5
+    with open(js_file, 'w') as changed:
+        changed.write(SOURCE.replace('a + b', 'a * b') + '\n')
+    assert depression.call_js_function(js_file, 'add', (2, 3)) == 6
+
+
+@pytest.mark.parametrize('processes', [None, 2])
+def test_call_many_returns_plain_values_in_every_mode(js_file, processes):
+    with depression.JsModule(js_file, processes=processes, chunk_size=2) as module:
+        results = module.call_many('point', [(index,) for index in range(5)])
+        assert results == [{'x': index, 'list': [1, 2, index], 'nested': {'y': [index]}} for index in range(5)]
+        assert all(type(result) is dict and type(result['list']) is list for result in results)
+        assert module.call_many('add', iter([(1, 2), ('a', 'b')])) == [3, 'ab']
+        assert type(module.call('point', 1)) is dict
@@ -0,0 +1,45 @@
+from json import dumps, loads
+
+import pytest
+
+from depression import iter_json_array, iter_json_lines
+
+DOCUMENT = '[1.5, -2.25e-7, 1e10, 3E+2, 0, -0.0, 12345678901234567890, 6.02214076e23, true, null, "1.5", {"x": [1e-7, 2.5]}, [], -1]'
+
+
+def _write(tmp_path, text: str) -> str:
+    path = tmp_path / 'data.json'
+    path.write_text(text)
+    return str(path)
+
+
+def test_every_split_point_inside_numbers(tmp_path):
+    path = _write(tmp_path, DOCUMENT)
+    for chunk_size in range(1, len(DOCUMENT) + 1):
+        assert list(iter_json_array(path, chunk_size)) == loads(DOCUMENT), chunk_size
+
+
+@pytest.mark.parametrize('padding', range(65525, 65540))
+def test_float_split_at_default_chunk_size(tmp_path, padding):
+    path = _write(tmp_path, '[' + ' ' * padding + '1.5e-3, 2.75]')
+    assert list(iter_json_array(path)) == [1.5e-3, 2.75]
+
+
+@pytest.mark.parametrize('text', ['[1e-7]', '[1.5e10, 2]', '[]', ' [ 1 , 2 ] '])
+def test_small_arrays(tmp_path, text):
+    path = _write(tmp_path, text)
+    for chunk_size in range(1, len(text) + 1):
+        assert list(iter_json_array(path, chunk_size)) == loads(text)
+
+
+@pytest.mark.parametrize('text', ['{"a": 1}', '[1 2]', '[1,', '[1.5e]'])
+def test_invalid_documents_raise(tmp_path, text):
+    with pytest.raises(ValueError):
+        list(iter_json_array(_write(tmp_path, text), 2))
+
+
+def test_iter_json_lines_skips_blank_lines(tmp_path):
+    items = [{'a': 1}, [1.5, None], 'text']
+    path = tmp_path / 'data.jsonl'
+    path.write_text('\n'.join(map(dumps, items)) + '\n\n  \n')
+    assert list(iter_json_lines(str(path))) == items
@@ -0,0 +1,100 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread, Lock
+from time import sleep, perf_counter
+
+import pytest
+
+from depression import HttpClient, scrape_many
+
+
+class Counter:
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.active = self.peak = 0
+
+    def __enter__(self) -> None:
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def __exit__(self, *error) -> None:
+        with self.lock:
+            self.active -= 1
+
+
+def _server(total: Counter):
+    host = Counter()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        wbufsize = 1 << 16
+
+        def do_GET(self) -> None:
+            with total, host:
+                sleep(float(self.path.rsplit('/', 1)[-1]))
+            body = f'<html>{self.path}</html>'.encode()
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server, host, f'http://127.0.0.1:{server.server_address[1]}'
+
+
+@pytest.fixture
+def servers():
+    total = Counter()
+    started = [_server(total) for _ in range(2)]
+    yield total, [(host, base) for _, host, base in started]
+    for server, *_ in started:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def client():
+    with HttpClient(retries=0, timeout=5) as client:
+        yield client
+
+
+def test_results_stream_back_as_they_complete(servers, client):
+    _, [(_, base), _] = servers
+    urls = [f'{base}/slow/0.8', f'{base}/fast/0.05', f'{base}/fast/0.1']
+    start = perf_counter()
+    results = scrape_many(urls, workers=3, per_host=3, client=client)
+
+    url, html, error = next(results)
+    assert url == urls[1] and error is None and html == '<html>/fast/0.05</html>'
+    assert perf_counter() - start < 0.6
+    assert [url for url, *_ in results] == [urls[2], urls[0]]
+
+
+def test_global_and_per_host_caps_hold(servers, client):
+    total, [(first, first_base), (second, second_base)] = servers
+    urls = [f'{base}/page{index}/0.1' for index in range(12) for base in (first_base, second_base)]
+    results = list(scrape_many(urls, workers=5, per_host=3, client=client))
+
+    assert sorted(url for url, *_ in results) == sorted(urls)
+    assert all(error is None for *_, error in results)
+    assert first.peak <= 3 and second.peak <= 3
+    assert 1 < total.peak <= 5
+
+
+def test_failing_urls_do_not_stop_the_rest(servers, client):
+    _, [(_, base), _] = servers
+    good = [f'{base}/page{index}/0.01' for index in range(5)]
+    bad = ['http://127.0.0.1:1/refused', 'not a url']
+    results = {url: (html, error) for url, html, error in scrape_many(bad + good, workers=3, client=client)}
+
+    assert set(results) == set(bad + good)
+    for url in good:
+        assert results[url] == (f'<html>{url[len(base):]}</html>', None)
+    for url in bad:
+        html, error = results[url]
+        assert html is None and isinstance(error, Exception)
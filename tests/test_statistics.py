@@ -0,0 +1,67 @@
+import random
+import statistics
+from decimal import Decimal
+from fractions import Fraction
+from math import inf, isnan
+
+import pytest
+
+from depression import get_mean, get_median, RunningStats, RunningQuantile
+
+random.seed(7)
+SAMPLES = [
+    [1, 2, 3], [1, 2], [1, 3, 2, 4], [True, 2], [1.5, 2, 3],
+    [Fraction(1, 3), Fraction(1, 2)], [Decimal('1.1'), Decimal('2')],
+    list(range(1001)), [random.randint(0, 9) for _ in range(1000)],
+    [random.random() for _ in range(1001)], [random.gauss(0, 1) for _ in range(2000)],
+]
+
+
+@pytest.mark.parametrize('numbers', SAMPLES)
+def test_matches_statistics(numbers):
+    mean = get_mean(numbers)
+    assert mean == pytest.approx(statistics.mean(numbers), rel=1e-15) and type(mean) is type(statistics.mean(numbers))
+    median = get_median(numbers)
+    assert median == statistics.median(numbers) and type(median) is type(statistics.median(numbers))
+
+
+def test_iterators_and_empty_input():
+    assert get_mean(iter([1, 2, 3, 4])) == 2.5
+    assert get_median(iter([3, 1, 2])) == 2
+    for function in (get_mean, get_median):
+        with pytest.raises(statistics.StatisticsError):
+            function([])
+
+
+def test_mean_falls_back_when_fsum_overflows():
+    assert get_mean([1e308, 1e308]) == statistics.mean([1e308, 1e308]) == 1e308
+    assert get_mean([1e308, 1e308, 1]) == statistics.mean([1e308, 1e308, 1])
+
+
+def test_mean_of_opposite_infinities_is_nan():
+    assert isnan(get_mean([inf, -inf]))
+    assert isnan(get_mean([1.0, inf, -inf]))
+    assert get_mean([1.0, inf]) == inf
+
+
+def test_running_stats_matches_statistics_and_merges():
+    numbers = [random.gauss(5, 2) for _ in range(10000)]
+    first, second = RunningStats(numbers[:3000]), RunningStats()
+    second.extend(numbers[3000:])
+    first.merge(second)
+
+    assert first.count == len(numbers)
+    assert first.mean == pytest.approx(statistics.fmean(numbers), rel=1e-12)
+    assert first.variance() == pytest.approx(statistics.variance(numbers), rel=1e-9)
+    assert first.stdev(sample=False) == pytest.approx(statistics.pstdev(numbers), rel=1e-9)
+    assert (first.min, first.max) == (min(numbers), max(numbers))
+    with pytest.raises(statistics.StatisticsError):
+        RunningStats([1]).variance()
+
+
+@pytest.mark.parametrize('quantile', [0.5, 0.9, 0.99])
+def test_running_quantile_estimate(quantile):
+    numbers = [random.gauss(0, 1) for _ in range(100000)]
+    exact = sorted(numbers)[int(quantile * len(numbers))]
+    assert RunningQuantile(quantile, numbers).value() == pytest.approx(exact, abs=0.02)
+    assert RunningQuantile(0.25, [1, 2, 3, 4, 5]).value() == 2